@@ -0,0 +1,207 @@
+"""
+Unified Command-Line Entry Point for the Assignment
+
+One command for every task. Each subcommand imports its task module (and
+with it numpy, pandas, scikit-learn or selenium) only when it runs, so
+``--help`` and the sorting benchmark start in a few tens of milliseconds.
+
+Usage:
+    python cli.py sort --sizes 10,100,1000
+    python cli.py login --url https://practicetestautomation.com/practice-test-login/
+    python cli.py login --compare
+    python cli.py train --save-model model.pkl [any priority_prediction.py option]
+    python cli.py score model.pkl issues.csv --output scored.csv
+    python cli.py serve model.pkl --port 8080
+    python cli.py ingest --model model.pkl --replay events.jsonl
+    python cli.py check-startup --budget-ms 250
+
+``check-startup`` exits with status 1 when a light command exceeds its
+startup budget or imports a heavy dependency, so it can guard CI against
+import-time regressions.
+"""
+
+import argparse
+import importlib
+import os
+import subprocess
+import sys
+import time
+from typing import List, Optional
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+TASK_DIRS = {
+    'code_completion': 'task1_code_completion',
+    'login_test': 'task2_automated_testing',
+    'priority_prediction': 'task3_predictive_analytics',
+    'model_service': 'task3_predictive_analytics',
+    'webhook_ingestion': 'task3_predictive_analytics',
+}
+
+# Must never be imported by the light commands probed in check-startup
+HEAVY_MODULES = ('numpy', 'pandas', 'scipy', 'sklearn', 'matplotlib', 'seaborn',
+                 'selenium', 'webdriver_manager')
+STARTUP_PROBES = [
+    ('cli --help', ['--help']),
+    ('sort --help', ['sort', '--help']),
+    ('login --help', ['login', '--help']),
+    ('import login_test', ['check-startup', '--import-only', 'login_test']),
+    ('import code_completion', ['check-startup', '--import-only', 'code_completion']),
+]
+
+
+def _task_module(name: str):
+    """Import a task script by name, adding its directory to sys.path."""
+    path = os.path.join(ROOT, TASK_DIRS[name])
+    if path not in sys.path:
+        sys.path.insert(0, path)
+    return importlib.import_module(name)
+
+
+def run_sort(args: argparse.Namespace, extra: List[str]) -> int:
+    sizes = [int(n) for n in args.sizes.split(',')]
+    _task_module('code_completion').main(sizes)
+    return 0
+
+
+def run_login(args: argparse.Namespace, extra: List[str]) -> int:
+    login_test = _task_module('login_test')
+    if args.compare:
+        login_test.compare_page_reuse(args.url)
+        return 0
+    tester = login_test.LoginPageTester(args.url)
+    tester.run_all_tests(reuse_page=not args.no_page_reuse)
+    return 0 if tester.test_suite.failed == 0 else 1
+
+
+def run_train(args: argparse.Namespace, extra: List[str]) -> int:
+    # Options are parsed by priority_prediction itself, so both entry points stay in sync
+    _task_module('priority_prediction').main(extra)
+    return 0
+
+
+def run_score(args: argparse.Namespace, extra: List[str]) -> int:
+    scored = _task_module('model_service').score_csv(
+        args.model, args.input, args.output, args.cache_dir
+    )
+    if args.output is None:
+        print(scored.to_csv(index=False), end='')
+    else:
+        print(f"✓ Scored {len(scored):,} issues -> {args.output}")
+    return 0
+
+
+def run_serve(args: argparse.Namespace, extra: List[str]) -> int:
+    _task_module('model_service').serve(args.model, args.host, args.port, args.cache_dir)
+    return 0
+
+
+def run_ingest(args: argparse.Namespace, extra: List[str]) -> int:
+    _task_module('webhook_ingestion').main(extra)
+    return 0
+
+
+def _heavy_imports(importtime_log: str) -> List[str]:
+    """Top-level heavy packages listed in a ``python -X importtime`` log."""
+    found = set()
+    for line in importtime_log.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            name = line.rsplit('|', 1)[1].strip().split('.')[0]
+            if name in HEAVY_MODULES:
+                found.add(name)
+    return sorted(found)
+
+
+def check_startup(budget_ms: float, repeats: int = 5) -> int:
+    """
+    Time each light command in fresh interpreters and look for heavy imports.
+
+    Returns:
+        0 when every probe is within budget and imports no heavy module, else 1
+    """
+    failures = 0
+    print(f"{'Probe':<26} {'median ms':>10} {'budget ms':>10}  heavy imports")
+    for label, argv in STARTUP_PROBES:
+        command = [sys.executable, '-X', 'importtime', os.path.abspath(__file__)] + argv
+        timings, heavy = [], []
+        for _ in range(repeats):
+            start_time = time.perf_counter()
+            completed = subprocess.run(command, capture_output=True, text=True)
+            timings.append((time.perf_counter() - start_time) * 1000)
+            heavy = _heavy_imports(completed.stderr)
+        median = sorted(timings)[len(timings) // 2]
+        ok = completed.returncode == 0 and median <= budget_ms and not heavy
+        failures += not ok
+        print(f"{label:<26} {median:10.1f} {budget_ms:10.0f}  "
+              f"{', '.join(heavy) or '-':<20} {'✓' if ok else '✗'}")
+    print("✓ Startup within budget" if not failures else f"✗ {failures} probe(s) regressed")
+    return 1 if failures else 0
+
+
+def run_check_startup(args: argparse.Namespace, extra: List[str]) -> int:
+    if args.import_only:
+        _task_module(args.import_only)
+        return 0
+    return check_startup(args.budget_ms, args.repeats)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="AI software solutions assignment")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    sort = commands.add_parser('sort', help="AI vs manual sorting benchmark (task 1)")
+    sort.add_argument('--sizes', default='10,100,1000', help="comma-separated dataset sizes")
+    sort.set_defaults(handler=run_sort)
+
+    login = commands.add_parser('login', help="Selenium login page tests (task 2)")
+    login.add_argument('--url', default="https://practicetestautomation.com/practice-test-login/",
+                       help="login page under test")
+    login.add_argument('--no-page-reuse', action='store_true',
+                       help="navigate to the page for every scenario")
+    login.add_argument('--compare', action='store_true',
+                       help="report scenarios/s with and without page reuse")
+    login.set_defaults(handler=run_login)
+
+    # add_help=False so 'train --help' shows priority_prediction's own options
+    train = commands.add_parser('train', add_help=False,
+                                help="train the priority model (task 3; see train --help)")
+    train.set_defaults(handler=run_train)
+
+    score = commands.add_parser('score', help="score a CSV of issues with a saved model")
+    score.add_argument('model', help="model saved with train --save-model")
+    score.add_argument('input', help="CSV of raw issue features")
+    score.add_argument('--output', default=None, help="scored CSV path (default: stdout)")
+    score.add_argument('--cache-dir', default=None, help="on-disk prediction cache")
+    score.set_defaults(handler=run_score)
+
+    serve = commands.add_parser('serve', help="serve predictions over HTTP")
+    serve.add_argument('model', help="model saved with train --save-model")
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=8080)
+    serve.add_argument('--cache-dir', default=None, help="on-disk prediction cache")
+    serve.set_defaults(handler=run_serve)
+
+    # Options are parsed by webhook_ingestion itself, like train
+    ingest = commands.add_parser('ingest', add_help=False,
+                                 help="webhook ingestion: --replay, --serve or --benchmark")
+    ingest.set_defaults(handler=run_ingest)
+
+    check = commands.add_parser('check-startup', help="fail if startup time regresses")
+    check.add_argument('--budget-ms', type=float, default=250,
+                       help="median wall-clock budget per probe")
+    check.add_argument('--repeats', type=int, default=5, help="runs per probe")
+    check.add_argument('--import-only', default=None, choices=sorted(TASK_DIRS),
+                       help=argparse.SUPPRESS)
+    check.set_defaults(handler=run_check_startup)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args, extra = parser.parse_known_args(argv)
+    if extra and args.command not in ('train', 'ingest'):
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
+    return args.handler(args, extra)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
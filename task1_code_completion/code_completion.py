@@ -93,17 +93,18 @@ def generate_test_data(size: int) -> List[Dict[str, Any]]:
     ]
 
 
-def benchmark_sorting_methods():
+def benchmark_sorting_methods(test_sizes: List[int] = (10, 100, 1000)):
     """
     Compare performance of AI-suggested vs Manual sorting implementations.
     Tests with different dataset sizes to demonstrate scalability.
+    
+    Args:
+        test_sizes: Dataset sizes to benchmark
     """
     print("="*70)
     print("PERFORMANCE COMPARISON: AI-Suggested vs Manual Implementation")
     print("="*70)
     
-    test_sizes = [10, 100, 1000]
-    
     for size in test_sizes:
         print(f"\nDataset Size: {size} items")
         print("-" * 70)
@@ -174,9 +175,12 @@ def demonstrate_functionality():
     print("\n✓ AI implementation handles missing keys gracefully with defaults")
 
 
-def main():
+def main(test_sizes: List[int] = (10, 100, 1000)):
     """
     Main execution function running all comparisons and demonstrations.
+    
+    Args:
+        test_sizes: Dataset sizes for the performance benchmark
     """
     print("\n")
     print("╔" + "="*68 + "╗")
@@ -187,7 +191,7 @@ def main():
     demonstrate_functionality()
     
     # Run performance benchmarks
-    benchmark_sorting_methods()
+    benchmark_sorting_methods(test_sizes)
     
     print("\n" + "="*70)
     print("ANALYSIS SUMMARY")
@@ -0,0 +1,241 @@
+"""
+Task 2: Automated Testing with AI
+Asynchronous Failure-Artifact Capture
+
+When a UI test fails, the browser state (screenshot, DOM and console log)
+is what explains the failure. Grabbing it has to happen on the test
+thread, before the next test navigates away, but that is only three
+WebDriver calls. Decoding, truncating, compressing and writing the files
+is handed to a background thread through a bounded queue, so a failing
+test costs little more than a passing one. If the queue is full the
+snapshot is dropped (and counted) rather than blocking the suite.
+
+Layout::
+
+    <root>/<run id>/<test name>/screenshot.png
+    <root>/<run id>/<test name>/dom.html.gz
+    <root>/<run id>/<test name>/console.json.gz
+    <root>/<run id>/index.json            # test -> artifact paths actually written
+
+Files are written under a temporary name and renamed, so a path stored
+in TestResult.artifacts never points at a half-written file. Old runs
+are deleted when a run starts, keeping at most ``keep_runs`` runs and
+``max_total_mb`` on disk.
+"""
+
+import base64
+import gzip
+import json
+import os
+import queue
+import re
+import shutil
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+@dataclass
+class ArtifactConfig:
+    """Where failure artifacts go and how much of them to keep."""
+    root: str = "test_artifacts"
+    screenshot: bool = True
+    dom: bool = True
+    console_log: bool = True
+    max_artifact_kb: int = 2048  # Per file, before compression; DOM is truncated, screenshots skipped
+    max_log_entries: int = 200  # Most recent console entries kept
+    compress_level: int = 6
+    queue_size: int = 8  # Snapshots waiting for the writer; more are dropped
+    keep_runs: int = 10
+    max_total_mb: float = 200.0
+
+
+@dataclass
+class _Snapshot:
+    test_name: str
+    test_dir: str
+    screenshot_b64: Optional[str] = None
+    dom: Optional[str] = None
+    console: Optional[List[Dict]] = None
+    url: str = ""
+    captured_at: float = field(default_factory=time.time)
+
+
+def _safe_name(name: str) -> str:
+    return re.sub(r'[^A-Za-z0-9_.-]+', '_', name).strip('_') or 'test'
+
+
+def _directory_size(path: str) -> int:
+    total = 0
+    for directory, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(directory, name))
+            except OSError:
+                pass
+    return total
+
+
+class ArtifactCapture:
+    """
+    Snapshot browser state on failure; compress and write it in the background.
+    """
+
+    def __init__(self, config: Optional[ArtifactConfig] = None):
+        """
+        Start a capture run.
+
+        Args:
+            config: Capture settings (default: ArtifactConfig())
+        """
+        self.config = config or ArtifactConfig()
+        run_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+        self.run_dir = os.path.join(self.config.root, run_id)
+        self.index: Dict[str, Dict[str, str]] = {}
+        self.dropped = 0
+        self.errors: List[str] = []
+        self.capture_seconds = 0.0
+        self._queue = queue.Queue(maxsize=self.config.queue_size)
+        self._worker = None
+
+    def start(self) -> "ArtifactCapture":
+        """Apply retention and start the writer thread."""
+        os.makedirs(self.config.root, exist_ok=True)
+        self._apply_retention(keep=self.config.keep_runs - 1)
+        self._worker = threading.Thread(target=self._write_loop, name="artifact-writer", daemon=True)
+        self._worker.start()
+        return self
+
+    def snapshot(self, driver, test_name: str) -> Dict[str, str]:
+        """
+        Grab the browser state and queue it for writing.
+
+        Args:
+            driver: Live WebDriver, still showing the failed page
+            test_name: Name of the failed test
+
+        Returns:
+            Artifact kind -> path the file will be written to (empty if the
+            snapshot was dropped or the browser could not be read)
+        """
+        start_time = time.perf_counter()
+        test_dir = os.path.join(self.run_dir, _safe_name(test_name))
+        snap = _Snapshot(test_name, test_dir)
+        try:
+            snap.url = driver.current_url
+            if self.config.screenshot:
+                snap.screenshot_b64 = driver.get_screenshot_as_base64()
+            if self.config.dom:
+                snap.dom = driver.page_source
+            if self.config.console_log:
+                try:
+                    snap.console = driver.get_log('browser')
+                except Exception:  # Not every driver exposes browser logs
+                    snap.console = None
+        except Exception as e:  # The browser itself may be what failed
+            self.errors.append(f"{test_name}: {type(e).__name__}: {e}")
+
+        # Decoded size of base64 is 3/4 of its length, so oversize screenshots
+        # are dropped here instead of being promised and skipped by the writer
+        if snap.screenshot_b64 is not None:
+            png_bytes = len(snap.screenshot_b64) * 3 // 4
+            if png_bytes > self.config.max_artifact_kb * 1024:
+                self.errors.append(f"{test_name}: screenshot of ~{png_bytes} bytes over limit")
+                snap.screenshot_b64 = None
+
+        links = {}
+        if snap.screenshot_b64 is not None:
+            links['screenshot'] = os.path.join(test_dir, 'screenshot.png')
+        if snap.dom is not None:
+            links['dom'] = os.path.join(test_dir, 'dom.html.gz')
+        if snap.console is not None:
+            links['console'] = os.path.join(test_dir, 'console.json.gz')
+        if links:
+            try:
+                self._queue.put_nowait(snap)
+            except queue.Full:
+                self.dropped += 1
+                links = {}
+        self.capture_seconds += time.perf_counter() - start_time
+        return links
+
+    def close(self) -> None:
+        """Wait for queued snapshots to be written, then write the run index."""
+        if self._worker is None:
+            return
+        self._queue.put(None)
+        self._worker.join()
+        self._worker = None
+        if self.index:
+            os.makedirs(self.run_dir, exist_ok=True)
+            self._write_file(os.path.join(self.run_dir, 'index.json'), json.dumps({
+                'tests': self.index,
+                'dropped': self.dropped,
+                'errors': self.errors,
+            }, indent=2).encode())
+        self._apply_retention(keep=self.config.keep_runs)
+
+    def _write_loop(self) -> None:
+        while True:
+            snap = self._queue.get()
+            if snap is None:
+                return
+            written = {}
+            try:
+                self._write_snapshot(snap, written)
+            except Exception as e:
+                self.errors.append(f"{snap.test_dir}: {type(e).__name__}: {e}")
+            if written:
+                self.index[snap.test_name] = written
+
+    def _write_snapshot(self, snap: _Snapshot, written: Dict[str, str]) -> None:
+        """Write the snapshot's files, recording each finished one in ``written``."""
+        os.makedirs(snap.test_dir, exist_ok=True)
+        limit = self.config.max_artifact_kb * 1024
+        level = self.config.compress_level
+
+        if snap.screenshot_b64 is not None:
+            path = os.path.join(snap.test_dir, 'screenshot.png')
+            self._write_file(path, base64.b64decode(snap.screenshot_b64))
+            written['screenshot'] = path
+        if snap.dom is not None:
+            dom = snap.dom.encode('utf-8', 'replace')
+            if len(dom) > limit:
+                dom = dom[:limit] + b"\n<!-- truncated by ArtifactCapture -->"
+            header = f"<!-- {snap.url} captured {time.ctime(snap.captured_at)} -->\n".encode()
+            path = os.path.join(snap.test_dir, 'dom.html.gz')
+            self._write_file(path, gzip.compress(header + dom, level))
+            written['dom'] = path
+        if snap.console is not None:
+            entries = snap.console[-self.config.max_log_entries:]
+            log = json.dumps(entries, indent=1).encode()[:limit]
+            path = os.path.join(snap.test_dir, 'console.json.gz')
+            self._write_file(path, gzip.compress(log, level))
+            written['console'] = path
+
+    @staticmethod
+    def _write_file(path: str, data: bytes) -> None:
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _apply_retention(self, keep: int) -> None:
+        """Delete the oldest runs beyond ``keep`` runs or ``max_total_mb``."""
+        root = self.config.root
+        runs = sorted(
+            (name for name in os.listdir(root)
+             if os.path.isdir(os.path.join(root, name))
+             and os.path.join(root, name) != self.run_dir),
+            reverse=True
+        )
+        budget = self.config.max_total_mb * 1024 ** 2
+        if os.path.isdir(self.run_dir):
+            budget -= _directory_size(self.run_dir)
+            keep -= 1
+        for i, name in enumerate(runs):
+            path = os.path.join(root, name)
+            budget -= _directory_size(path)
+            if i >= max(keep, 0) or budget < 0:
+                shutil.rmtree(path, ignore_errors=True)
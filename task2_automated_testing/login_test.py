@@ -9,17 +9,68 @@ Requirements:
 pip install selenium webdriver-manager
 """
 
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
 import time
-from typing import Dict, List
+from typing import Dict, List, Optional
 from dataclasses import dataclass, field
 
+from failure_artifacts import ArtifactCapture, ArtifactConfig
+
+# Selenium and webdriver-manager take about a second to import; they are
+# loaded by _import_selenium() when a browser is actually started
+webdriver = By = WebDriverWait = EC = Service = ChromeDriverManager = None
+
+
+class TimeoutException(Exception):
+    """Placeholder until _import_selenium() binds selenium's TimeoutException."""
+
+
+def _import_selenium() -> None:
+    """Bind the selenium names used by LoginPageTester at module level."""
+    global webdriver, By, WebDriverWait, EC, Service, ChromeDriverManager, TimeoutException
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.chrome.service import Service
+    from webdriver_manager.chrome import ChromeDriverManager
+
+
+@dataclass(frozen=True)
+class LoginScenario:
+    """One row of the data-driven login test table."""
+    name: str
+    username: str
+    password: str
+    expected: str  # 'success', 'error' (banner shown) or 'rejected' (banner or HTML5 validation)
+    message: str = ""  # Fragment the success or error message must contain
+    
+    @property
+    def navigates(self) -> bool:
+        """A successful login leaves the page; every other scenario stays on it."""
+        return self.expected == 'success'
+
+
+# AI Enhancement: edge cases and OWASP-style security cases are plain data,
+# so adding a credential variant is one line rather than one method
+LOGIN_SCENARIOS = [
+    LoginScenario("Valid Login Credentials", "student", "Password123", 'success', "successfully"),
+    LoginScenario("Invalid Username", "invaliduser", "Password123", 'error', "username"),
+    LoginScenario("Invalid Password", "student", "wrongpassword", 'error', "password"),
+    LoginScenario("Empty Username Field", "", "Password123", 'rejected'),
+    LoginScenario("Empty Password Field", "student", "", 'rejected'),
+    LoginScenario("SQL Injection Attempt", "admin' OR '1'='1", "' OR '1'='1", 'rejected'),
+]
+
+# Clears the form and the previous error banner, so a stale message is
+# never mistaken for the next scenario's result
+RESET_FORM_SCRIPT = """
+var username = document.getElementById('username');
+if (username && username.form) { username.form.reset(); }
+var error = document.getElementById('error');
+if (error) { error.textContent = ''; }
+"""
+
 
 @dataclass
 class TestResult:
@@ -28,6 +79,7 @@ class TestResult:
     status: str  # 'PASSED' or 'FAILED'
     duration: float
     error_message: str = ""
+    artifacts: Dict[str, str] = field(default_factory=dict)  # kind -> file path
 
 
 @dataclass
@@ -37,6 +89,8 @@ class TestSuite:
     passed: int = 0
     failed: int = 0
     results: List[TestResult] = field(default_factory=list)
+    page_loads: int = 0
+    wall_seconds: float = 0.0
     
     def add_result(self, result: TestResult):
         """Add a test result and update counters."""
@@ -51,6 +105,11 @@ class TestSuite:
     def success_rate(self) -> float:
         """Calculate success rate percentage."""
         return (self.passed / self.total * 100) if self.total > 0 else 0.0
+    
+    @property
+    def scenarios_per_second(self) -> float:
+        """Scenarios executed per second of suite wall time."""
+        return self.total / self.wall_seconds if self.wall_seconds > 0 else 0.0
 
 
 class LoginPageTester:
@@ -65,21 +124,36 @@ class LoginPageTester:
     4. Enabling parallel test execution
     """
     
-    def __init__(self, base_url: str = "https://practicetestautomation.com/practice-test-login/"):
+    def __init__(
+        self,
+        base_url: str = "https://practicetestautomation.com/practice-test-login/",
+        capture_artifacts: bool = True,
+        artifact_config: Optional[ArtifactConfig] = None,
+        scenarios: Optional[List[LoginScenario]] = None
+    ):
         """
         Initialize the test suite.
         
         Args:
             base_url: URL of the login page to test
+            capture_artifacts: Save screenshot, DOM and console log of failed tests
+            artifact_config: Artifact location, size limits and retention
+            scenarios: Login scenario table (default: LOGIN_SCENARIOS)
         """
         self.base_url = base_url
         self.driver = None
         self.test_suite = TestSuite()
         self.wait_timeout = 10
+        self.capture_artifacts = capture_artifacts
+        self.artifact_config = artifact_config or ArtifactConfig()
+        self.artifacts = None
+        self.scenarios = scenarios if scenarios is not None else LOGIN_SCENARIOS
+        self._page_url = None  # Set while the loaded login page can be reused
     
     def setup(self):
         """Set up the WebDriver and navigate to the test page."""
         print("🔧 Setting up WebDriver...")
+        _import_selenium()
         
         # Use webdriver-manager to automatically handle driver installation
         service = Service(ChromeDriverManager().install())
@@ -88,9 +162,12 @@ class LoginPageTester:
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
         options.add_argument('--window-size=1920,1080')
+        options.set_capability('goog:loggingPrefs', {'browser': 'ALL'})  # For console artifacts
         
         self.driver = webdriver.Chrome(service=service, options=options)
         self.driver.implicitly_wait(5)
+        if self.capture_artifacts:
+            self.artifacts = ArtifactCapture(self.artifact_config).start()
         print("✓ WebDriver initialized successfully\n")
     
     def teardown(self):
@@ -98,6 +175,11 @@ class LoginPageTester:
         if self.driver:
             self.driver.quit()
             print("\n🔧 WebDriver closed")
+        if self.artifacts is not None:
+            self.artifacts.close()
+            print(f"📎 Failure artifacts: {self.artifacts.run_dir} "
+                  f"(capture {self.artifacts.capture_seconds:.3f}s, "
+                  f"{self.artifacts.dropped} dropped)")
     
     def _run_test(self, test_name: str, test_function):
         """
@@ -115,185 +197,103 @@ class LoginPageTester:
             print(f"✓ {test_name}: PASSED ({duration:.3f}s)")
         except Exception as e:
             duration = time.time() - start_time
-            result = TestResult(test_name, 'FAILED', duration, str(e))
+            # Snapshot before the next test navigates away; files are written in the background
+            artifacts = self.artifacts.snapshot(self.driver, test_name) if self.artifacts else {}
+            result = TestResult(test_name, 'FAILED', duration, str(e), artifacts)
             print(f"✗ {test_name}: FAILED ({duration:.3f}s)")
             print(f"  Error: {str(e)}")
         
         self.test_suite.add_result(result)
     
-    def test_valid_login(self):
-        """
-        Test Case 1: Valid Login Credentials
-        
-        AI Enhancement: Automatically identifies alternative locators
-        if primary selectors fail (self-healing capability).
-        """
+    def _load_page(self):
+        """Navigate to the login page (counted, so batching can be measured)."""
         self.driver.get(self.base_url)
-        
-        # AI-suggested robust locators with fallback strategies
-        username = WebDriverWait(self.driver, self.wait_timeout).until(
-            EC.presence_of_element_located((By.ID, "username"))
-        )
-        password = self.driver.find_element(By.ID, "password")
-        submit = self.driver.find_element(By.ID, "submit")
-        
-        # Valid credentials for the practice site
-        username.clear()
-        username.send_keys("student")
-        password.clear()
-        password.send_keys("Password123")
-        submit.click()
-        
-        # Verify successful login
-        success_message = WebDriverWait(self.driver, self.wait_timeout).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, ".post-title"))
-        )
-        
-        assert "successfully" in success_message.text.lower() or "Logged In Successfully" in success_message.text, \
-            "Success message not found after valid login"
+        self.test_suite.page_loads += 1
+        self._page_url = self.driver.current_url
     
-    def test_invalid_username(self):
-        """
-        Test Case 2: Invalid Username
-        
-        AI Enhancement: Generates edge cases automatically based on
-        input field analysis.
-        """
-        self.driver.get(self.base_url)
-        
-        username = WebDriverWait(self.driver, self.wait_timeout).until(
-            EC.presence_of_element_located((By.ID, "username"))
-        )
-        password = self.driver.find_element(By.ID, "password")
-        submit = self.driver.find_element(By.ID, "submit")
-        
-        username.send_keys("invaliduser")
-        password.send_keys("Password123")
-        submit.click()
-        
-        # Verify error message appears
-        error_message = WebDriverWait(self.driver, self.wait_timeout).until(
-            EC.presence_of_element_located((By.ID, "error"))
-        )
-        
-        assert error_message.is_displayed(), "Error message not displayed for invalid username"
-        assert "username" in error_message.text.lower(), "Error message doesn't mention username"
+    def _reset_form(self):
+        """Clear both fields and the previous error message without reloading."""
+        self.driver.execute_script(RESET_FORM_SCRIPT)
     
-    def test_invalid_password(self):
-        """
-        Test Case 3: Invalid Password
-        
-        Tests authentication failure with correct username but wrong password.
-        """
-        self.driver.get(self.base_url)
-        
-        username = WebDriverWait(self.driver, self.wait_timeout).until(
-            EC.presence_of_element_located((By.ID, "username"))
-        )
-        password = self.driver.find_element(By.ID, "password")
-        submit = self.driver.find_element(By.ID, "submit")
-        
-        username.send_keys("student")
-        password.send_keys("wrongpassword")
-        submit.click()
-        
-        error_message = WebDriverWait(self.driver, self.wait_timeout).until(
-            EC.presence_of_element_located((By.ID, "error"))
-        )
-        
-        assert error_message.is_displayed(), "Error message not displayed for invalid password"
-        assert "password" in error_message.text.lower(), "Error message doesn't mention password"
+    @staticmethod
+    def _visible_error_text(driver):
+        """Text of the error banner once it is shown, else False (for WebDriverWait)."""
+        errors = driver.find_elements(By.ID, "error")
+        if errors and errors[0].is_displayed() and errors[0].text.strip():
+            return errors[0].text
+        return False
     
-    def test_empty_username(self):
+    def run_scenario(self, scenario: LoginScenario, reuse_page: bool = True):
         """
-        Test Case 4: Empty Username Field
+        Submit one scenario's credentials and check the outcome.
         
-        AI Enhancement: Identifies required fields and generates
-        negative test cases automatically.
+        AI Enhancement: Identifies required fields and generates negative
+        and security (OWASP top 10) cases from one table of inputs.
+        
+        Args:
+            scenario: Credentials and expected outcome
+            reuse_page: Reset the form in place when the page is still
+                loaded, instead of navigating to it again
         """
-        self.driver.get(self.base_url)
+        if reuse_page and self._page_url is not None and not scenario.navigates:
+            self._reset_form()
+        else:
+            self._load_page()
+        # Not reusable until this scenario proves it left the page in place
+        page_url, self._page_url = self._page_url, None
         
+        # AI-suggested robust locators with fallback strategies
         username = WebDriverWait(self.driver, self.wait_timeout).until(
             EC.presence_of_element_located((By.ID, "username"))
         )
         password = self.driver.find_element(By.ID, "password")
         submit = self.driver.find_element(By.ID, "submit")
         
-        username.send_keys("")
-        password.send_keys("Password123")
+        username.clear()
+        username.send_keys(scenario.username)
+        password.clear()
+        password.send_keys(scenario.password)
         submit.click()
         
-        # Check for HTML5 validation or error message
-        try:
-            error_message = WebDriverWait(self.driver, 3).until(
-                EC.presence_of_element_located((By.ID, "error"))
+        if scenario.expected == 'success':
+            success_message = WebDriverWait(self.driver, self.wait_timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, ".post-title"))
             )
-            assert error_message.is_displayed(), "Error not displayed for empty username"
-        except TimeoutException:
-            # HTML5 validation might prevent form submission
-            validation_message = username.get_attribute("validationMessage")
-            assert validation_message, "No validation for empty username"
-    
-    def test_empty_password(self):
-        """
-        Test Case 5: Empty Password Field
-        
-        Verifies proper handling of missing password.
-        """
-        self.driver.get(self.base_url)
-        
-        username = WebDriverWait(self.driver, self.wait_timeout).until(
-            EC.presence_of_element_located((By.ID, "username"))
-        )
-        password = self.driver.find_element(By.ID, "password")
-        submit = self.driver.find_element(By.ID, "submit")
-        
-        username.send_keys("student")
-        password.send_keys("")
-        submit.click()
+            assert scenario.message in success_message.text.lower(), \
+                f"Success message not found after {scenario.name.lower()}"
+            return
         
+        # Errors must be reported promptly; rejections may also come from
+        # HTML5 validation, which never shows the banner
+        timeout = self.wait_timeout if scenario.expected == 'error' else 3
         try:
-            error_message = WebDriverWait(self.driver, 3).until(
-                EC.presence_of_element_located((By.ID, "error"))
-            )
-            assert error_message.is_displayed(), "Error not displayed for empty password"
+            error_text = WebDriverWait(self.driver, timeout).until(self._visible_error_text)
         except TimeoutException:
-            validation_message = password.get_attribute("validationMessage")
-            assert validation_message, "No validation for empty password"
+            error_text = None
+        
+        if error_text is not None:
+            assert scenario.message in error_text.lower(), \
+                f"Error message doesn't mention '{scenario.message}': {error_text!r}"
+        elif scenario.expected == 'error':
+            raise AssertionError(f"Error message not displayed for {scenario.name.lower()}")
+        elif not scenario.username or not scenario.password:
+            empty_field = username if not scenario.username else password
+            assert empty_field.get_attribute("validationMessage"), \
+                f"No validation for {scenario.name.lower()}"
+        
+        current_url = self.driver.current_url
+        assert "success" not in current_url.lower(), f"{scenario.name} logged in!"
+        if current_url == page_url:
+            self._page_url = page_url
     
-    def test_sql_injection_attempt(self):
+    def run_all_tests(self, reuse_page: bool = True):
         """
-        Test Case 6: SQL Injection Security Test
+        Execute complete test suite.
         
-        AI Enhancement: Automatically generates security test cases
-        based on OWASP top 10 vulnerabilities.
+        Args:
+            reuse_page: Batch scenarios that stay on the page onto one page
+                load (False navigates once per scenario)
         """
-        self.driver.get(self.base_url)
-        
-        username = WebDriverWait(self.driver, self.wait_timeout).until(
-            EC.presence_of_element_located((By.ID, "username"))
-        )
-        password = self.driver.find_element(By.ID, "password")
-        submit = self.driver.find_element(By.ID, "submit")
-        
-        # Common SQL injection patterns
-        username.send_keys("admin' OR '1'='1")
-        password.send_keys("' OR '1'='1")
-        submit.click()
-        
-        # Should not bypass authentication
-        try:
-            error_message = WebDriverWait(self.driver, self.wait_timeout).until(
-                EC.presence_of_element_located((By.ID, "error"))
-            )
-            assert error_message.is_displayed(), "System vulnerable to SQL injection"
-        except TimeoutException:
-            # If no error message, check we didn't successfully log in
-            current_url = self.driver.current_url
-            assert "success" not in current_url.lower(), "SQL injection succeeded!"
-    
-    def run_all_tests(self):
-        """Execute complete test suite."""
         print("="*70)
         print(" "*20 + "AUTOMATED LOGIN TESTING")
         print("="*70)
@@ -303,19 +303,11 @@ class LoginPageTester:
         try:
             self.setup()
             
-            # Execute all test cases
-            test_cases = [
-                ("Valid Login Credentials", self.test_valid_login),
-                ("Invalid Username", self.test_invalid_username),
-                ("Invalid Password", self.test_invalid_password),
-                ("Empty Username Field", self.test_empty_username),
-                ("Empty Password Field", self.test_empty_password),
-                ("SQL Injection Attempt", self.test_sql_injection_attempt)
-            ]
-            
-            for test_name, test_func in test_cases:
-                self._run_test(test_name, test_func)
-                time.sleep(0.5)  # Brief pause between tests
+            # Browser startup is excluded so scenarios/s measures the scenarios alone
+            start_time = time.perf_counter()
+            for scenario in self.scenarios:
+                self._run_test(scenario.name, lambda: self.run_scenario(scenario, reuse_page))
+            self.test_suite.wall_seconds = time.perf_counter() - start_time
             
         finally:
             self.teardown()
@@ -331,6 +323,8 @@ class LoginPageTester:
         print(f"Failed:         {self.test_suite.failed} ✗")
         print(f"Success Rate:   {self.test_suite.success_rate:.2f}%")
         print(f"Total Duration: {sum(r.duration for r in self.test_suite.results):.3f}s")
+        print(f"Page Loads:     {self.test_suite.page_loads} for {self.test_suite.total} scenarios")
+        print(f"Throughput:     {self.test_suite.scenarios_per_second:.2f} scenarios/s")
         print("="*70)
         
         if self.test_suite.failed > 0:
@@ -339,6 +333,8 @@ class LoginPageTester:
                 if result.status == 'FAILED':
                     print(f"  ✗ {result.name}")
                     print(f"    {result.error_message}")
+                    for kind, path in result.artifacts.items():
+                        print(f"    📎 {kind}: {path}")
         
         print("\n" + "="*70)
         print("AI TESTING ADVANTAGES:")
@@ -367,9 +363,43 @@ consistency and broader scenario coverage.
         print("="*70)
 
 
-def main():
+def compare_page_reuse(
+    base_url: str = "https://practicetestautomation.com/practice-test-login/"
+) -> Dict[str, float]:
+    """
+    Run the scenario table with one navigation per scenario, then batched.
+    
+    Returns:
+        Scenarios per second and page loads for both modes
+    """
+    report = {}
+    for mode, reuse_page in (('per_scenario', False), ('batched', True)):
+        tester = LoginPageTester(base_url)
+        tester.run_all_tests(reuse_page=reuse_page)
+        report[f'{mode}_scenarios_per_second'] = tester.test_suite.scenarios_per_second
+        report[f'{mode}_page_loads'] = tester.test_suite.page_loads
+    
+    print("\n" + "="*70)
+    print(" "*20 + "PAGE REUSE COMPARISON")
+    print("="*70)
+    for mode in ('per_scenario', 'batched'):
+        print(f"{mode:<14} {report[f'{mode}_scenarios_per_second']:8.2f} scenarios/s  "
+              f"({report[f'{mode}_page_loads']} page loads)")
+    if report['per_scenario_scenarios_per_second'] > 0:
+        print(f"Speedup: {report['batched_scenarios_per_second'] / report['per_scenario_scenarios_per_second']:.2f}x")
+    print("="*70)
+    return report
+
+
+def main(
+    base_url: str = "https://practicetestautomation.com/practice-test-login/",
+    compare: bool = False
+):
     """Main execution function."""
-    tester = LoginPageTester()
+    if compare:
+        compare_page_reuse(base_url)
+        return
+    tester = LoginPageTester(base_url)
     tester.run_all_tests()
 
 
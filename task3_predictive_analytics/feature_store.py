@@ -0,0 +1,244 @@
+"""
+Task 3: Predictive Analytics for Resource Allocation
+Content-Hashed On-Disk Feature Store
+
+Engineered and scaled feature matrices are cached as ``.npy`` files that
+are opened with ``mmap_mode='r'``, so repeat runs on unchanged data read
+pages on demand instead of recomputing features. Entries are keyed by a
+hash of the input data and the feature-spec version; when the input only
+gained rows at the end, derived columns are computed for the new rows
+alone and appended to the cached prefix.
+
+Layout::
+
+    <root>/<key>/manifest.json   # kind, columns, row count, data hash
+    <root>/<key>/index.npy       # row index; object indexes are stored as strings
+    <root>/<key>/col_0000.npy    # one file per column (kind='columns')
+    <root>/<key>/<name>.npy      # one file per array (kind='arrays')
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def _value_bytes(values: np.ndarray) -> bytes:
+    """Bytes identifying an array's values; object arrays hash their contents, not pointers."""
+    if values.dtype == object:
+        return pd.util.hash_array(values.ravel()).tobytes()
+    return np.ascontiguousarray(values).tobytes()
+
+
+def hash_frame(data) -> str:
+    """
+    Content hash of a DataFrame, Series or array.
+
+    Column names, dtypes, the index and the values all contribute, so any
+    edit to the data yields a new key, and equal data yields the same key
+    in every process (string IDs are hashed by value).
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    if isinstance(data, pd.Series):
+        data = data.to_frame()
+    if isinstance(data, pd.DataFrame):
+        digest.update(json.dumps([str(c) for c in data.columns]).encode())
+        digest.update(pd.util.hash_pandas_object(data.index, index=False).to_numpy().tobytes())
+        for name in data.columns:
+            column = data[name].to_numpy()
+            digest.update(str(column.dtype).encode())
+            digest.update(_value_bytes(column))
+    else:
+        array = np.asarray(data)
+        digest.update(f"{array.dtype}{array.shape}".encode())
+        digest.update(_value_bytes(array))
+    return digest.hexdigest()
+
+
+def is_memory_mapped(frame: pd.DataFrame) -> bool:
+    """True if every column of ``frame`` is a view of a memory-mapped file."""
+    for name in frame.columns:
+        array = frame[name].to_numpy()
+        while array is not None and not isinstance(array, np.memmap):
+            array = getattr(array, "base", None)
+        if array is None:
+            return False
+    return True
+
+
+class FeatureStore:
+    """
+    Directory of memory-mappable feature matrices keyed by content hash.
+
+    Entries are written to a temporary directory and renamed into place,
+    so a crashed run never leaves a half-written entry behind.
+    """
+
+    def __init__(self, root: str = ".feature_store"):
+        """
+        Open (and create if needed) a feature store.
+
+        Args:
+            root: Directory holding the cache entries
+        """
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+
+    @staticmethod
+    def key(*parts: Any) -> str:
+        """Combine key parts (hashes, versions, parameters) into one key."""
+        return hashlib.blake2b(
+            json.dumps([str(p) for p in parts]).encode(), digest_size=16
+        ).hexdigest()
+
+    def _entry(self, key: str) -> str:
+        return os.path.join(self.root, key)
+
+    def _manifest(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(os.path.join(self._entry(key), "manifest.json")) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _commit(self, key: str, write: Callable[[str], Dict[str, Any]]) -> None:
+        """Write an entry into a scratch directory, then rename it into place."""
+        scratch = tempfile.mkdtemp(dir=self.root, prefix=".tmp-")
+        try:
+            manifest = write(scratch)
+            with open(os.path.join(scratch, "manifest.json"), "w") as f:
+                json.dump(manifest, f)
+            target = self._entry(key)
+            if os.path.isdir(target):
+                shutil.rmtree(target)
+            os.replace(scratch, target)
+        finally:
+            if os.path.isdir(scratch):
+                shutil.rmtree(scratch)
+
+    def save_columns(self, key: str, frame: pd.DataFrame, meta: Optional[Dict] = None) -> None:
+        """Store a DataFrame as one memory-mappable file per column."""
+        def write(path: str) -> Dict[str, Any]:
+            index = frame.index.to_numpy()
+            if index.dtype == object:
+                index = index.astype(str)  # Unicode array: no pickle, same values on reload
+            np.save(os.path.join(path, "index.npy"), index)
+            for i, name in enumerate(frame.columns):
+                np.save(os.path.join(path, f"col_{i:04d}.npy"),
+                        np.ascontiguousarray(frame[name].to_numpy()))
+            return {
+                "kind": "columns",
+                "columns": [str(c) for c in frame.columns],
+                "n_rows": len(frame),
+                **(meta or {}),
+            }
+        self._commit(key, write)
+
+    def load_columns(self, key: str) -> Optional[pd.DataFrame]:
+        """Load a column entry, or None if it is not cached."""
+        manifest = self._manifest(key)
+        if manifest is None or manifest.get("kind") != "columns":
+            return None
+        path = self._entry(key)
+        columns = {
+            name: np.load(os.path.join(path, f"col_{i:04d}.npy"), mmap_mode="r")
+            for i, name in enumerate(manifest["columns"])
+        }
+        index = np.load(os.path.join(path, "index.npy"))
+        # copy=False keeps one block per column, each a view of its mapped file;
+        # the default would consolidate them into a single in-memory block
+        return pd.DataFrame(columns, index=index, copy=False)
+
+    def save_arrays(self, key: str, arrays: Dict[str, np.ndarray], meta: Optional[Dict] = None) -> None:
+        """Store named arrays (e.g. scaled train/test matrices) as .npy files."""
+        def write(path: str) -> Dict[str, Any]:
+            for name, array in arrays.items():
+                np.save(os.path.join(path, f"{name}.npy"), np.asarray(array))
+            return {"kind": "arrays", "arrays": sorted(arrays), **(meta or {})}
+        self._commit(key, write)
+
+    def load_arrays(self, key: str) -> Optional[Dict[str, np.ndarray]]:
+        """Memory-map the arrays of an entry, or return None if it is not cached."""
+        manifest = self._manifest(key)
+        if manifest is None or manifest.get("kind") != "arrays":
+            return None
+        path = self._entry(key)
+        return {
+            name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r")
+            for name in manifest["arrays"]
+        }
+
+    def _find_prefix(self, X: pd.DataFrame, spec_version: str) -> Optional[Tuple[str, int]]:
+        """Find the longest cached engineered entry whose input is a prefix of X."""
+        best = None
+        columns = [str(c) for c in X.columns]
+        for key in os.listdir(self.root):
+            manifest = self._manifest(key)
+            if (
+                manifest is None
+                or manifest.get("kind") != "columns"
+                or manifest.get("spec_version") != spec_version
+                or manifest.get("input_columns") != columns
+                or not 0 < manifest["n_rows"] < len(X)
+                or (best is not None and manifest["n_rows"] <= best[1])
+            ):
+                continue
+            if hash_frame(X.iloc[:manifest["n_rows"]]) == manifest["input_hash"]:
+                best = (key, manifest["n_rows"])
+        return best
+
+    def engineered(
+        self,
+        X: pd.DataFrame,
+        spec_version: str,
+        derive: Callable[[pd.DataFrame], pd.DataFrame]
+    ) -> Tuple[pd.DataFrame, str, str]:
+        """
+        Return ``derive(X)``, computing only what the cache does not hold.
+
+        ``derive`` must be row-wise (each output row depends only on the same
+        input row), which is what makes appending rows safe.
+
+        Args:
+            X: Raw input features
+            spec_version: Version of the feature definitions
+            derive: Function producing the engineered frame
+
+        Returns:
+            Tuple of (engineered frame, entry key, status) where status is
+            'hit', 'append' or 'miss'
+        """
+        input_hash = hash_frame(X)
+        key = self.key("engineered", input_hash, spec_version)
+        cached = self.load_columns(key)
+        if cached is not None:
+            return cached, key, "hit"
+
+        meta = {
+            "spec_version": spec_version,
+            "input_hash": input_hash,
+            "input_columns": [str(c) for c in X.columns],
+        }
+        prefix = self._find_prefix(X, spec_version)
+        if prefix is not None:
+            prefix_key, n_cached = prefix
+            head = self.load_columns(prefix_key)
+            tail = derive(X.iloc[n_cached:])
+            engineered = pd.concat([head, tail[head.columns]])
+            status = "append"
+        else:
+            engineered = derive(X)
+            status = "miss"
+
+        self.save_columns(key, engineered, meta)
+        return engineered, key, status
+
+    def clear(self) -> None:
+        """Delete every cached entry."""
+        shutil.rmtree(self.root, ignore_errors=True)
+        os.makedirs(self.root, exist_ok=True)
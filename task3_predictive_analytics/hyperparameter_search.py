@@ -0,0 +1,288 @@
+"""
+Task 3: Predictive Analytics for Resource Allocation
+Budgeted Hyperparameter Search for the Priority Random Forest
+
+Successive halving treats the number of trees as the budget: every candidate
+starts with a small forest, only the best third survives each rung, and the
+survivors are grown with ``warm_start`` instead of being refit from scratch.
+The stratified CV folds are computed once and reused by every rung.
+
+Requirements:
+pip install scikit-learn numpy
+"""
+
+import os
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.metrics import f1_score
+from sklearn.model_selection import ParameterSampler, StratifiedKFold
+
+
+# Search space around the hand-picked defaults used by train_model
+DEFAULT_PARAM_SPACE = {
+    'max_depth': [6, 8, 10, 14, None],
+    'min_samples_split': [2, 5, 10],
+    'min_samples_leaf': [1, 2, 4],
+    'max_features': ['sqrt', 'log2', 0.5],
+}
+
+
+@dataclass
+class CandidateScore:
+    """Cross-validated score of one configuration at one rung."""
+    params: Dict[str, Any]
+    n_estimators: int
+    f1_mean: float
+    f1_std: float
+    fit_seconds: float
+
+
+@dataclass
+class SearchResult:
+    """Outcome of a successive-halving search."""
+    best_params: Dict[str, Any]
+    best_n_estimators: int
+    cv_f1_mean: float
+    cv_f1_std: float
+    train_seconds: float = 0.0
+    predict_ms_per_1k: float = 0.0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    forests_grown: int = 0
+    budget_exhausted: bool = False
+    history: List[CandidateScore] = field(default_factory=list)
+
+
+class SuccessiveHalvingForestSearch:
+    """
+    Budgeted successive-halving search over RandomForestClassifier settings.
+
+    Each (candidate, fold) pair keeps a single warm-started forest for the
+    whole search, so promoting a candidate from 10 to 30 trees only builds
+    the 20 new trees. Fold fits run on a thread pool; tree construction in
+    scikit-learn releases the GIL, so threads avoid pickling forests between
+    processes. At most ``n_workers`` fits are in flight and the budget is
+    checked before each new one, so a budget is overrun by at most one fit
+    per worker.
+    """
+
+    def __init__(
+        self,
+        param_space: Optional[Dict[str, List[Any]]] = None,
+        n_candidates: int = 18,
+        min_estimators: int = 10,
+        max_estimators: int = 270,
+        eta: int = 3,
+        cv: int = 5,
+        n_workers: Optional[int] = None,
+        time_budget: Optional[float] = None,
+        cpu_budget: Optional[float] = None,
+        random_state: int = 42,
+    ):
+        """
+        Initialize the search.
+
+        Args:
+            param_space: Mapping of forest parameter to candidate values
+            n_candidates: Number of sampled configurations in the first rung
+            min_estimators: Trees per forest in the first rung
+            max_estimators: Upper bound on trees per forest
+            eta: Promotion factor (keep 1/eta, grow trees eta-fold)
+            cv: Number of stratified folds, shared by every rung
+            n_workers: Thread pool size for fold fits (default: CPU count)
+            time_budget: Wall-clock limit in seconds, or None for no limit (the
+                first candidate is scored even if the budget is already spent)
+            cpu_budget: Process CPU-time limit in seconds, or None for no limit
+            random_state: Seed for sampling, folds and forests
+        """
+        if eta < 2:
+            raise ValueError("eta must be at least 2")
+        if min_estimators < 1 or max_estimators < min_estimators:
+            raise ValueError("need 1 <= min_estimators <= max_estimators")
+        if any(budget is not None and budget <= 0 for budget in (time_budget, cpu_budget)):
+            raise ValueError("time and CPU budgets must be positive")
+
+        self.param_space = param_space or DEFAULT_PARAM_SPACE
+        self.n_candidates = n_candidates
+        self.min_estimators = min_estimators
+        self.max_estimators = max_estimators
+        self.eta = eta
+        self.cv = cv
+        self.n_workers = n_workers
+        self.time_budget = time_budget
+        self.cpu_budget = cpu_budget
+        self.random_state = random_state
+
+    def _budget_left(self, wall_start: float, cpu_start: float) -> bool:
+        """Check whether both the wall-clock and CPU budgets still allow work."""
+        if self.time_budget is not None and time.perf_counter() - wall_start >= self.time_budget:
+            return False
+        if self.cpu_budget is not None and time.process_time() - cpu_start >= self.cpu_budget:
+            return False
+        return True
+
+    def _grow_and_score(
+        self,
+        forest: RandomForestClassifier,
+        n_estimators: int,
+        X: np.ndarray,
+        y: np.ndarray,
+        train_idx: np.ndarray,
+        val_idx: np.ndarray,
+    ) -> Tuple[float, float]:
+        """Grow a fold forest to ``n_estimators`` trees and score it on its fold."""
+        start = time.perf_counter()
+        forest.set_params(n_estimators=n_estimators)
+        forest.fit(X[train_idx], y[train_idx])
+        fit_seconds = time.perf_counter() - start
+        y_pred = forest.predict(X[val_idx])
+        return f1_score(y[val_idx], y_pred, average='weighted'), fit_seconds
+
+    def search(self, X: np.ndarray, y) -> SearchResult:
+        """
+        Run successive halving on the training data.
+
+        Args:
+            X: Scaled training features
+            y: Training labels
+
+        Returns:
+            SearchResult describing the best configuration found
+        """
+        X = np.asarray(X)
+        y = np.asarray(y)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+
+        folds = list(StratifiedKFold(
+            n_splits=self.cv, shuffle=True, random_state=self.random_state
+        ).split(X, y))
+        candidates = list(ParameterSampler(
+            self.param_space, n_iter=self.n_candidates, random_state=self.random_state
+        ))
+        forests = {
+            (c, f): RandomForestClassifier(
+                warm_start=True,
+                class_weight='balanced',
+                random_state=self.random_state,
+                n_jobs=1,
+                **params,
+            )
+            for c, params in enumerate(candidates)
+            for f in range(len(folds))
+        }
+
+        history: List[CandidateScore] = []
+        survivors = list(range(len(candidates)))
+        n_estimators = self.min_estimators
+        best: Optional[CandidateScore] = None
+        forests_grown = 0
+        exhausted = False
+
+        n_workers = self.n_workers or os.cpu_count() or 1
+        with ThreadPoolExecutor(max_workers=n_workers) as pool:
+            while survivors:
+                # The first candidate is always scored, so a spent budget still yields a model
+                if best is not None and not self._budget_left(wall_start, cpu_start):
+                    exhausted = True
+                    break
+
+                pending = deque((c, f) for c in survivors for f in range(len(folds)))
+                always_run = set(list(pending)[:len(folds)]) if best is None else set()
+                running, results = {}, {}
+                while pending or running:
+                    while pending and len(running) < n_workers:
+                        if pending[0] not in always_run and not self._budget_left(wall_start, cpu_start):
+                            # Submit nothing more; fits already running finish and count
+                            exhausted = True
+                            pending.clear()
+                            break
+                        c, f = pending.popleft()
+                        train_idx, val_idx = folds[f]
+                        job = pool.submit(self._grow_and_score, forests[(c, f)], n_estimators,
+                                          X, y, train_idx, val_idx)
+                        running[job] = (c, f)
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for job in done:
+                        results[running.pop(job)] = job.result()
+                        forests_grown += 1
+
+                # Only candidates scored on every fold take part in the rung
+                rung = []
+                for c in survivors:
+                    if any((c, f) not in results for f in range(len(folds))):
+                        continue
+                    fold_results = [results[(c, f)] for f in range(len(folds))]
+                    scores = np.array([r[0] for r in fold_results])
+                    rung.append(CandidateScore(
+                        params=candidates[c],
+                        n_estimators=n_estimators,
+                        f1_mean=float(scores.mean()),
+                        f1_std=float(scores.std()),
+                        fit_seconds=float(sum(r[1] for r in fold_results)),
+                    ))
+                history.extend(rung)
+
+                if exhausted:
+                    # A cut-short rung may hold only some candidates; keep the earlier best if none
+                    if rung:
+                        best = max(rung, key=lambda score: score.f1_mean)
+                    break
+                order = sorted(range(len(rung)), key=lambda i: rung[i].f1_mean, reverse=True)
+                best = rung[order[0]]
+
+                # Free forests of eliminated candidates before growing the rest
+                keep = max(1, len(survivors) // self.eta)
+                for i in order[keep:]:
+                    for f in range(len(folds)):
+                        del forests[(survivors[i], f)]
+                survivors = [survivors[i] for i in order[:keep]]
+
+                if n_estimators >= self.max_estimators:
+                    break
+                if len(survivors) == 1:
+                    # A lone survivor only needs growing to the final size
+                    n_estimators = self.max_estimators
+                else:
+                    n_estimators = min(n_estimators * self.eta, self.max_estimators)
+
+        if best is None:
+            raise RuntimeError("search budget exhausted before the first rung finished")
+
+        return SearchResult(
+            best_params=dict(best.params),
+            best_n_estimators=best.n_estimators,
+            cv_f1_mean=best.f1_mean,
+            cv_f1_std=best.f1_std,
+            wall_seconds=time.perf_counter() - wall_start,
+            cpu_seconds=time.process_time() - cpu_start,
+            forests_grown=forests_grown,
+            budget_exhausted=exhausted,
+            history=history,
+        )
+
+
+def measure_inference_cost(model: RandomForestClassifier, X: np.ndarray, repeats: int = 3) -> float:
+    """
+    Measure ``predict_proba`` latency.
+
+    Args:
+        model: Fitted forest
+        X: Rows to score
+        repeats: Number of timed passes (the fastest is kept)
+
+    Returns:
+        Milliseconds per 1,000 rows
+    """
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        model.predict_proba(X)
+        timings.append(time.perf_counter() - start)
+    return min(timings) / max(len(X), 1) * 1_000_000
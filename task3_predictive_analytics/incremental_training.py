@@ -0,0 +1,472 @@
+"""
+Task 3: Predictive Analytics for Resource Allocation
+Incremental Retraining with Drift Detection
+
+Instead of rerunning the whole pipeline every month, new labeled issues are
+folded into the existing model:
+
+- the StandardScaler is updated online with ``partial_fit`` and the split
+  thresholds of every existing tree are remapped so old trees keep seeing
+  the same raw values they were trained on;
+- a few new trees are trained on a window of recent issues and appended to
+  the forest, and the oldest trees are retired once the forest is full;
+- feature drift (population stability index per feature), label drift and
+  prequential accuracy are monitored, and a full retrain on all history is
+  triggered only when one of them crosses its threshold.
+
+Requirements:
+pip install pandas scikit-learn numpy
+"""
+
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.metrics import accuracy_score, f1_score
+from sklearn.preprocessing import StandardScaler
+
+
+@dataclass
+class DriftThresholds:
+    """Thresholds above which a full retrain is triggered."""
+    feature_psi: float = 0.25  # Conventional "significant shift" PSI level
+    min_drifted_features: int = 3  # One noisy column out of 35 is not drift
+    label_distance: float = 0.15  # Total variation distance between class mixes
+    accuracy_drop: float = 0.10  # Absolute drop versus earlier batches since the last fit
+    min_batch_size: int = 30  # Smaller batches are too noisy to trigger on
+
+
+@dataclass
+class DriftReport:
+    """Drift statistics for one ingested batch."""
+    max_feature_psi: float
+    drifted_features: List[str]
+    label_distance: float
+    batch_accuracy: float
+    accuracy_drop: float
+    triggered: bool
+    reasons: List[str] = field(default_factory=list)
+
+
+@dataclass
+class UpdateResult:
+    """Outcome of ingesting one batch of labeled issues."""
+    action: str  # 'incremental', 'full_retrain' or 'skipped'
+    seconds: float
+    n_trees: int
+    drift: Optional[DriftReport] = None
+
+
+class DriftMonitor:
+    """
+    Compares incoming batches against a reference sample.
+
+    Feature drift uses the population stability index over reference
+    quantile bins, minus its expected value under no drift so that small
+    batches do not trip the threshold on sampling noise alone; label drift
+    uses the total variation distance between class distributions.
+    """
+
+    def __init__(
+        self,
+        X_ref: np.ndarray,
+        y_ref: np.ndarray,
+        feature_names: List[str],
+        n_classes: int,
+        n_bins: int = 10
+    ):
+        """
+        Build reference histograms.
+
+        Args:
+            X_ref: Reference features (unscaled)
+            y_ref: Reference labels
+            feature_names: Column names, used in reports
+            n_classes: Number of priority classes
+            n_bins: Quantile bins per feature
+        """
+        self.feature_names = feature_names
+        self.n_classes = n_classes
+        quantiles = np.linspace(0, 1, n_bins + 1)[1:-1]
+        self.bin_edges = np.quantile(X_ref, quantiles, axis=0).T
+        self.n_ref = len(X_ref)
+        self.ref_hist = self._histograms(X_ref)
+        self.ref_labels = self._label_distribution(y_ref)
+
+    def _histograms(self, X: np.ndarray) -> np.ndarray:
+        """Per-feature bin proportions, smoothed to avoid empty bins."""
+        counts = np.empty((X.shape[1], self.bin_edges.shape[1] + 1))
+        for j in range(X.shape[1]):
+            bins = np.searchsorted(self.bin_edges[j], X[:, j], side='right')
+            counts[j] = np.bincount(bins, minlength=counts.shape[1])
+        counts += 0.5
+        return counts / counts.sum(axis=1, keepdims=True)
+
+    def _label_distribution(self, y: np.ndarray) -> np.ndarray:
+        counts = np.bincount(np.asarray(y, dtype=int), minlength=self.n_classes)
+        return counts / max(counts.sum(), 1)
+
+    def feature_psi(self, X: np.ndarray) -> np.ndarray:
+        """Bias-corrected population stability index of every feature."""
+        hist = self._histograms(X)
+        psi = ((hist - self.ref_hist) * np.log(hist / self.ref_hist)).sum(axis=1)
+        # PSI is approximately chi-square: E[PSI] ~ (bins - 1) * (1/n + 1/N)
+        noise = (hist.shape[1] - 1) * (1 / max(len(X), 1) + 1 / self.n_ref)
+        return np.maximum(psi - noise, 0.0)
+
+    def label_distance(self, y: np.ndarray) -> float:
+        """Total variation distance between batch and reference class mix."""
+        return float(0.5 * np.abs(self._label_distribution(y) - self.ref_labels).sum())
+
+
+class IncrementalPriorityTrainer:
+    """
+    Keeps a trained PriorityPredictionModel current without full refits.
+
+    The trainer works on the engineered (unscaled) feature matrix and owns
+    ``model.model`` and ``model.scaler`` of the wrapped pipeline: after every
+    update they are still a plain RandomForestClassifier and StandardScaler,
+    so evaluation and prediction code keeps working unchanged.
+    """
+
+    def __init__(
+        self,
+        model,
+        X_reference: pd.DataFrame,
+        y_reference: pd.Series,
+        trees_per_update: int = 10,
+        max_trees: Optional[int] = None,
+        window_size: int = 500,
+        thresholds: Optional[DriftThresholds] = None
+    ):
+        """
+        Wrap an already trained pipeline.
+
+        Args:
+            model: PriorityPredictionModel with fitted ``model`` and ``scaler``
+            X_reference: Engineered, unscaled features the model was trained on
+            y_reference: Labels for X_reference
+            trees_per_update: Trees trained on the recent window per batch
+            max_trees: Forest size cap; oldest trees are retired beyond it
+                (default: the forest's original size, i.e. replace mode)
+            window_size: Number of most recent issues new trees learn from
+            thresholds: Drift thresholds that trigger a full retrain
+        """
+        if model.model is None or model.scaler is None:
+            raise ValueError("model must be trained before incremental updates")
+
+        self.pipeline = model
+        self.trees_per_update = trees_per_update
+        self.base_n_estimators = model.model.n_estimators
+        self.max_trees = max_trees or self.base_n_estimators
+        self.thresholds = thresholds or DriftThresholds()
+        self.n_classes = len(model.class_names)
+        self.feature_names = list(X_reference.columns)
+
+        X_ref = np.asarray(X_reference, dtype=np.float64)
+        y_ref = np.asarray(y_reference, dtype=int)
+        self.history_X: List[np.ndarray] = [X_ref]
+        self.history_y: List[np.ndarray] = [y_ref]
+        self.window: Deque[Tuple[np.ndarray, np.ndarray]] = deque()
+        self.window_size = window_size
+        self._push_window(X_ref, y_ref)
+
+        # Generation of every tree, parallel to estimators_, so the oldest go first
+        self.tree_generation = [0] * len(model.model.estimators_)
+        self.generation = 0
+        self._reset_reference(X_ref, y_ref)
+
+    def _push_window(self, X: np.ndarray, y: np.ndarray) -> None:
+        """Append rows to the recent-issue window and trim it to size."""
+        self.window.append((X, y))
+        rows = sum(len(wy) for _, wy in self.window)
+        while len(self.window) > 1 and rows - len(self.window[0][1]) >= self.window_size:
+            rows -= len(self.window.popleft()[1])
+
+    def _window_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        X = np.vstack([wx for wx, _ in self.window])[-self.window_size:]
+        y = np.concatenate([wy for _, wy in self.window])[-self.window_size:]
+        return X, y
+
+    def _reset_reference(self, X_ref: np.ndarray, y_ref: np.ndarray) -> None:
+        """Take a new drift baseline after a full (re)train."""
+        self.monitor = DriftMonitor(X_ref, y_ref, self.feature_names, self.n_classes)
+        # Training accuracy is optimistic, so the baseline is built from the
+        # prequential accuracy of batches seen after this (re)fit
+        self.batch_accuracies: List[float] = []
+
+    def _remap_thresholds(self, old_mean: np.ndarray, old_scale: np.ndarray) -> None:
+        """
+        Move every split threshold into the updated scaler's coordinates.
+
+        A threshold t learned on (x - m0) / s0 is the raw value t*s0 + m0,
+        which is (t*s0 + m0 - m1) / s1 after the update. Trees compare
+        float32 inputs, so rows lying within float32 rounding of a split can
+        still change side.
+        """
+        new_mean = self.pipeline.scaler.mean_
+        new_scale = self.pipeline.scaler.scale_
+        for tree in self.pipeline.model.estimators_:
+            nodes = tree.tree_
+            split = nodes.feature >= 0
+            feature = nodes.feature[split]
+            threshold = nodes.threshold
+            threshold[split] = (
+                threshold[split] * old_scale[feature] + old_mean[feature] - new_mean[feature]
+            ) / new_scale[feature]
+
+    def check_drift(self, X: np.ndarray, y: np.ndarray) -> DriftReport:
+        """
+        Measure drift of a new batch against the reference.
+
+        Args:
+            X: Engineered, unscaled features of the batch
+            y: Labels of the batch
+
+        Returns:
+            DriftReport; ``triggered`` is True when a full retrain is due
+        """
+        psi = self.monitor.feature_psi(X)
+        label_distance = self.monitor.label_distance(y)
+        X_scaled = self.pipeline.scaler.transform(X)
+        batch_accuracy = accuracy_score(y, self.pipeline.model.predict(X_scaled))
+        accuracy_drop = (
+            float(np.mean(self.batch_accuracies)) - batch_accuracy
+            if self.batch_accuracies else 0.0
+        )
+
+        drifted = [
+            self.feature_names[j] for j in np.argsort(psi)[::-1]
+            if psi[j] > self.thresholds.feature_psi
+        ]
+        reasons = []
+        if len(y) >= self.thresholds.min_batch_size:
+            if len(drifted) >= self.thresholds.min_drifted_features:
+                reasons.append(f"feature PSI {psi.max():.3f} on {len(drifted)} feature(s)")
+            if label_distance > self.thresholds.label_distance:
+                reasons.append(f"label distance {label_distance:.3f}")
+            if accuracy_drop > self.thresholds.accuracy_drop:
+                reasons.append(f"accuracy drop {accuracy_drop:.3f}")
+
+        return DriftReport(
+            max_feature_psi=float(psi.max()),
+            drifted_features=drifted,
+            label_distance=label_distance,
+            batch_accuracy=batch_accuracy,
+            accuracy_drop=accuracy_drop,
+            triggered=bool(reasons),
+            reasons=reasons
+        )
+
+    def full_retrain(self) -> None:
+        """Refit scaler and forest from scratch on all ingested history."""
+        X_all = np.vstack(self.history_X)
+        y_all = np.concatenate(self.history_y)
+
+        self.pipeline.scaler = StandardScaler()
+        X_scaled = self.pipeline.scaler.fit_transform(X_all)
+        forest = clone(self.pipeline.model)
+        forest.set_params(n_estimators=self.base_n_estimators, warm_start=False)
+        forest.fit(X_scaled, y_all)
+        self.pipeline.model = forest
+
+        self.generation += 1
+        self.tree_generation = [self.generation] * len(forest.estimators_)
+        # Compare future batches with what is current now, not with all history
+        self._reset_reference(*self._window_arrays())
+
+    def _append_trees(self) -> bool:
+        """Train trees on the recent window and merge them into the forest."""
+        X_recent, y_recent = self._window_arrays()
+        if len(np.unique(y_recent)) < self.n_classes:
+            # Trees that never saw a class would return narrower probabilities
+            return False
+
+        forest = self.pipeline.model
+        recent = clone(forest)
+        recent.set_params(
+            n_estimators=self.trees_per_update,
+            warm_start=False,
+            random_state=self.pipeline.random_state + self.generation + 1
+        )
+        recent.fit(self.pipeline.scaler.transform(X_recent), y_recent)
+
+        self.generation += 1
+        forest.estimators_.extend(recent.estimators_)
+        self.tree_generation.extend([self.generation] * len(recent.estimators_))
+
+        excess = len(forest.estimators_) - self.max_trees
+        if excess > 0:
+            oldest = np.argsort(self.tree_generation, kind='stable')[:excess]
+            keep = sorted(set(range(len(forest.estimators_))) - set(oldest.tolist()))
+            forest.estimators_ = [forest.estimators_[i] for i in keep]
+            self.tree_generation = [self.tree_generation[i] for i in keep]
+        forest.n_estimators = len(forest.estimators_)
+        return True
+
+    def ingest(self, X_new: pd.DataFrame, y_new: pd.Series) -> UpdateResult:
+        """
+        Fold a batch of newly labeled issues into the model.
+
+        Args:
+            X_new: Engineered, unscaled features (same columns as the reference)
+            y_new: Priority labels
+
+        Returns:
+            UpdateResult describing what was done and how long it took
+        """
+        start_time = time.perf_counter()
+        X = np.asarray(X_new, dtype=np.float64)
+        y = np.asarray(y_new, dtype=int)
+
+        drift = self.check_drift(X, y)
+        self.batch_accuracies.append(drift.batch_accuracy)
+        self.history_X.append(X)
+        self.history_y.append(y)
+        self._push_window(X, y)
+
+        if drift.triggered:
+            self.full_retrain()
+            action = 'full_retrain'
+        else:
+            scaler = self.pipeline.scaler
+            old_mean, old_scale = scaler.mean_.copy(), scaler.scale_.copy()
+            scaler.partial_fit(X)
+            self._remap_thresholds(old_mean, old_scale)
+            action = 'incremental' if self._append_trees() else 'skipped'
+
+        return UpdateResult(
+            action=action,
+            seconds=time.perf_counter() - start_time,
+            n_trees=len(self.pipeline.model.estimators_),
+            drift=drift
+        )
+
+
+def replay_comparison(
+    X: pd.DataFrame,
+    y: pd.Series,
+    n_batches: int = 8,
+    initial_fraction: float = 0.3,
+    drift_after: Optional[int] = None,
+    random_state: int = 42
+) -> Dict[str, Dict[str, List[float]]]:
+    """
+    Replay the data as a time series and compare update strategies.
+
+    Rows are shuffled once, the first ``initial_fraction`` trains both
+    models, and the rest arrives in ``n_batches`` batches. Every batch is
+    scored before it is learned from (prequential evaluation). One strategy
+    refits scaler and forest on all history per batch; the other uses
+    IncrementalPriorityTrainer.
+
+    Args:
+        X: Engineered, unscaled features
+        y: Labels
+        n_batches: Number of arriving batches
+        initial_fraction: Share of rows used for the initial fit
+        drift_after: If set, batches from this index on get a synthetic
+            covariate shift (top-variance features scaled by 1.5)
+        random_state: Seed for ordering and models
+
+    Returns:
+        Mapping of strategy name to per-batch 'seconds', 'accuracy', 'f1'
+        and, for the incremental strategy, 'action'
+    """
+    from priority_prediction import PriorityPredictionModel
+
+    rng = np.random.default_rng(random_state)
+    order = rng.permutation(len(X))
+    X_arr = np.asarray(X, dtype=np.float64)[order]
+    y_arr = np.asarray(y, dtype=int)[order]
+    n_initial = int(len(X_arr) * initial_fraction)
+    shifted = np.argsort(X_arr.var(axis=0))[::-1][:5]
+
+    def fresh_pipeline(X_fit: np.ndarray, y_fit: np.ndarray):
+        pipeline = PriorityPredictionModel(random_state=random_state)
+        pipeline.scaler = StandardScaler()
+        pipeline.model = RandomForestClassifier(
+            n_estimators=100, max_depth=10, min_samples_split=5,
+            min_samples_leaf=2, max_features='sqrt',
+            random_state=random_state, n_jobs=-1, class_weight='balanced'
+        )
+        pipeline.model.fit(pipeline.scaler.fit_transform(X_fit), y_fit)
+        return pipeline
+
+    full = fresh_pipeline(X_arr[:n_initial], y_arr[:n_initial])
+    incremental = IncrementalPriorityTrainer(
+        fresh_pipeline(X_arr[:n_initial], y_arr[:n_initial]),
+        pd.DataFrame(X_arr[:n_initial], columns=list(X.columns)),
+        pd.Series(y_arr[:n_initial]),
+        window_size=n_initial
+    )
+
+    results = {
+        'full_refit': {'seconds': [], 'accuracy': [], 'f1': []},
+        'incremental': {'seconds': [], 'accuracy': [], 'f1': [], 'action': []},
+    }
+    seen_X, seen_y = [X_arr[:n_initial]], [y_arr[:n_initial]]
+
+    for b, (X_batch, y_batch) in enumerate(zip(
+        np.array_split(X_arr[n_initial:], n_batches),
+        np.array_split(y_arr[n_initial:], n_batches)
+    )):
+        if drift_after is not None and b >= drift_after:
+            X_batch = X_batch.copy()
+            X_batch[:, shifted] *= 1.5
+
+        for name, pipeline in (('full_refit', full), ('incremental', incremental.pipeline)):
+            y_pred = pipeline.model.predict(pipeline.scaler.transform(X_batch))
+            results[name]['accuracy'].append(accuracy_score(y_batch, y_pred))
+            results[name]['f1'].append(f1_score(y_batch, y_pred, average='weighted'))
+
+        seen_X.append(X_batch)
+        seen_y.append(y_batch)
+        start_time = time.perf_counter()
+        full = fresh_pipeline(np.vstack(seen_X), np.concatenate(seen_y))
+        results['full_refit']['seconds'].append(time.perf_counter() - start_time)
+
+        update = incremental.ingest(
+            pd.DataFrame(X_batch, columns=list(X.columns)), pd.Series(y_batch)
+        )
+        results['incremental']['seconds'].append(update.seconds)
+        results['incremental']['action'].append(update.action)
+
+    return results
+
+
+def main():
+    """Replay the proxy dataset and compare incremental updates with full refits."""
+    from priority_prediction import PriorityPredictionModel
+
+    pipeline = PriorityPredictionModel(random_state=42)
+    X, y = pipeline.load_and_preprocess_data()
+    X = pipeline.engineer_features(X)
+
+    print("\n" + "="*70)
+    print(" "*14 + "INCREMENTAL RETRAINING vs FULL REFIT (REPLAY)")
+    print("="*70)
+    results = replay_comparison(X, y, n_batches=8, drift_after=5)
+
+    full, inc = results['full_refit'], results['incremental']
+    print(f"\n{'Batch':<7} {'Full s':>8} {'Full acc':>9} {'Incr s':>8} {'Incr acc':>9}  Action")
+    print("-" * 70)
+    for b in range(len(full['seconds'])):
+        print(f"{b + 1:<7} {full['seconds'][b]:8.3f} {full['accuracy'][b]:9.4f} "
+              f"{inc['seconds'][b]:8.3f} {inc['accuracy'][b]:9.4f}  {inc['action'][b]}")
+    print("-" * 70)
+    print(f"{'Total':<7} {sum(full['seconds']):8.3f} {np.mean(full['accuracy']):9.4f} "
+          f"{sum(inc['seconds']):8.3f} {np.mean(inc['accuracy']):9.4f}")
+    print(f"\n✓ Incremental updates used {sum(inc['seconds']) / max(sum(full['seconds']), 1e-9) * 100:.1f}% "
+          f"of the full-refit training time")
+    print("  (batches 6+ carry a synthetic covariate shift to exercise drift detection)")
+    print("="*70)
+
+
+if __name__ == "__main__":
+    main()
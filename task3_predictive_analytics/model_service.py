@@ -0,0 +1,134 @@
+"""
+Task 3: Predictive Analytics for Resource Allocation
+Batch Scoring and HTTP Serving for a Saved Priority Model
+
+Both entry points load a model written by ``priority_prediction.py
+--save-model`` and score raw issue rows through
+PriorityPredictionModel.score_issues, with a PredictionCache in front of
+the forest so unchanged issues are not re-scored.
+
+HTTP API::
+
+    GET  /health    model feature count and cache statistics
+    POST /predict   {"issues": [{"mean radius": 14.2, ...}, ...]}
+                    -> {"predictions": [{"priority": "High", "probabilities": {...}}, ...]}
+
+Requirements:
+pip install pandas scikit-learn numpy
+"""
+
+import json
+import time
+from dataclasses import asdict
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Optional
+
+import pandas as pd
+
+from prediction_cache import PredictionCache
+from priority_prediction import PriorityPredictionModel
+
+
+def load_pipeline(model_path: str, cache_dir: Optional[str] = None) -> PriorityPredictionModel:
+    """Load a saved model with a prediction cache attached."""
+    return PriorityPredictionModel.load(model_path, PredictionCache(cache_dir=cache_dir))
+
+
+def score_csv(
+    model_path: str,
+    input_path: str,
+    output_path: Optional[str] = None,
+    cache_dir: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    Score every issue in a CSV file of raw feature columns.
+
+    Args:
+        model_path: Model pickled by PriorityPredictionModel.save
+        input_path: CSV with the raw feature columns (extra columns are kept
+            in the output alongside the predictions)
+        output_path: Where to write the scored CSV (None: return only)
+        cache_dir: Disk tier of the prediction cache, shared between runs
+
+    Returns:
+        Input rows joined with the predicted priority and probabilities
+    """
+    pipeline = load_pipeline(model_path, cache_dir)
+    issues = pd.read_csv(input_path)
+    scored = issues.join(pipeline.score_issues(issues))
+    if output_path is not None:
+        scored.to_csv(output_path, index=False)
+    return scored
+
+
+def make_handler(pipeline: PriorityPredictionModel):
+    """Request handler class bound to one loaded pipeline."""
+
+    class PredictionHandler(BaseHTTPRequestHandler):
+        def _reply(self, status: int, body: dict) -> None:
+            payload = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_GET(self):
+            if self.path != '/health':
+                self._reply(404, {'error': 'not found'})
+                return
+            cache = pipeline.prediction_cache
+            self._reply(200, {
+                'status': 'ok',
+                'features': len(pipeline.feature_names),
+                'cache': {**asdict(cache.stats), 'hit_rate': cache.stats.hit_rate,
+                          'latency_saved_seconds': cache.stats.latency_saved_seconds,
+                          'entries': len(cache)},
+            })
+
+        def do_POST(self):
+            if self.path != '/predict':
+                self._reply(404, {'error': 'not found'})
+                return
+            try:
+                body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+                issues = pd.DataFrame(body['issues'] if isinstance(body, dict) else body)
+                start_time = time.perf_counter()
+                scored = pipeline.score_issues(issues)
+            except (ValueError, KeyError, TypeError) as e:
+                self._reply(400, {'error': f"{type(e).__name__}: {e}"})
+                return
+            probability_columns = [c for c in scored.columns if c != 'priority']
+            self._reply(200, {
+                'predictions': [
+                    {'priority': row.priority,
+                     'probabilities': {name: getattr(row, column) for name, column
+                                       in zip(pipeline.class_names, probability_columns)}}
+                    for row in scored.itertuples()
+                ],
+                'milliseconds': (time.perf_counter() - start_time) * 1000,
+            })
+
+        def log_message(self, format, *args):
+            pass  # Keep the console for the startup banner
+
+    return PredictionHandler
+
+
+def serve(
+    model_path: str,
+    host: str = '127.0.0.1',
+    port: int = 8080,
+    cache_dir: Optional[str] = None
+) -> None:
+    """Serve predictions over HTTP until interrupted."""
+    pipeline = load_pipeline(model_path, cache_dir)
+    server = HTTPServer((host, port), make_handler(pipeline))
+    print(f"🚀 Serving {model_path} on http://{host}:{server.server_port} "
+          f"(POST /predict, GET /health)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,172 @@
+"""
+Task 3: Predictive Analytics for Resource Allocation
+Parallel, Cached Permutation Importance
+
+Impurity-based importances favour high-variance columns such as the
+engineered squared areas. Permutation importance measures the drop in
+weighted F1 when one column is shuffled instead. To keep it affordable:
+
+- the baseline score is computed once and shared by every task (only the
+  score: every shuffle changes the predictions, so those are recomputed);
+- each worker holds one Fortran-ordered float32 copy of the evaluation
+  matrix and shuffles a column in place (a column is contiguous, so only
+  that column's memory is touched), restoring it afterwards instead of
+  copying the matrix per permutation. float32 is what the forest's
+  predict works on, so it does not convert the matrix on every call;
+- feature x repeat work is spread over a process pool;
+- results are cached on disk per model artifact hash and dataset hash.
+
+Requirements:
+pip install scikit-learn numpy
+"""
+
+import hashlib
+import json
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import List, Optional, Tuple
+
+import numpy as np
+from sklearn.metrics import f1_score
+
+from feature_store import hash_frame
+from streaming_metrics import pin_single_thread
+
+
+@dataclass
+class PermutationImportance:
+    """Mean and spread of the score drop for every feature."""
+    importances_mean: List[float]
+    importances_std: List[float]
+    baseline_score: float
+    n_repeats: int
+    cached: bool = False
+
+
+# Per-worker state, set once by _init_worker
+_state = {}
+
+
+def _init_worker(
+    model,
+    X: np.ndarray,
+    y: np.ndarray,
+    baseline: float,
+    random_state: int,
+    single_threaded: bool = False
+) -> None:
+    if single_threaded:
+        pin_single_thread(model)
+    _state.update(
+        model=model,
+        X=np.array(X, dtype=np.float32, order='F'),  # Private, column-contiguous working copy
+        y=y,
+        baseline=baseline,
+        random_state=random_state
+    )
+
+
+def _score(model, X: np.ndarray, y: np.ndarray) -> float:
+    return f1_score(y, model.predict(X), average='weighted')
+
+
+def _permute_feature(task: Tuple[int, List[int]]) -> Tuple[int, List[float]]:
+    """Score drops for one feature over the given repeats, shuffling in place."""
+    feature, repeats = task
+    model, X, y = _state['model'], _state['X'], _state['y']
+    column = X[:, feature]
+    original = column.copy()
+    drops = []
+    try:
+        for r in repeats:
+            # Seeded per (feature, repeat) so results do not depend on scheduling
+            rng = np.random.default_rng([_state['random_state'], feature, r])
+            column[:] = original[rng.permutation(len(original))]
+            drops.append(_state['baseline'] - _score(model, X, y))
+    finally:
+        column[:] = original
+    return feature, drops
+
+
+def _cache_key(model, X: np.ndarray, y: np.ndarray, n_repeats: int, random_state: int) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(pickle.dumps(model))
+    for part in (hash_frame(np.asarray(X)), hash_frame(np.asarray(y)), n_repeats, random_state):
+        digest.update(str(part).encode())
+    return digest.hexdigest()
+
+
+def permutation_importance(
+    model,
+    X: np.ndarray,
+    y,
+    n_repeats: int = 5,
+    n_workers: Optional[int] = None,
+    random_state: int = 42,
+    cache_dir: Optional[str] = ".importance_cache"
+) -> PermutationImportance:
+    """
+    Compute permutation importance on a process pool, with on-disk caching.
+
+    Args:
+        model: Fitted classifier
+        X: Evaluation features (typically the scaled test set)
+        y: Evaluation labels
+        n_repeats: Shuffles per feature
+        n_workers: Worker processes (default: CPU count; 1 runs in-process)
+        random_state: Seed for the shuffles
+        cache_dir: Directory for cached results, or None to disable caching
+
+    Returns:
+        PermutationImportance with one mean/std drop per column of X
+    """
+    X = np.asarray(X)
+    y = np.asarray(y)
+    cache_path = None
+    if cache_dir is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        cache_path = os.path.join(
+            cache_dir, _cache_key(model, X, y, n_repeats, random_state) + ".json"
+        )
+        if os.path.exists(cache_path):
+            with open(cache_path) as f:
+                return PermutationImportance(**{**json.load(f), 'cached': True})
+
+    baseline = _score(model, X, y)
+    n_workers = n_workers or os.cpu_count() or 1
+    # One task per feature and chunk of repeats, so idle workers can steal repeats
+    repeat_chunks = np.array_split(np.arange(n_repeats), min(n_repeats, max(1, n_workers)))
+    tasks = [
+        (feature, chunk.tolist())
+        for feature in range(X.shape[1])
+        for chunk in repeat_chunks if len(chunk)
+    ]
+
+    drops = [[] for _ in range(X.shape[1])]
+    if n_workers == 1:
+        _init_worker(model, X, y, baseline, random_state)
+        results = map(_permute_feature, tasks)
+        for feature, feature_drops in results:
+            drops[feature].extend(feature_drops)
+        _state.clear()
+    else:
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=_init_worker,
+            initargs=(model, X, y, baseline, random_state, True)
+        ) as pool:
+            for feature, feature_drops in pool.map(_permute_feature, tasks):
+                drops[feature].extend(feature_drops)
+
+    result = PermutationImportance(
+        importances_mean=[float(np.mean(d)) for d in drops],
+        importances_std=[float(np.std(d)) for d in drops],
+        baseline_score=float(baseline),
+        n_repeats=n_repeats
+    )
+    if cache_path is not None:
+        with open(cache_path, "w") as f:
+            json.dump({k: v for k, v in asdict(result).items() if k != 'cached'}, f)
+    return result
@@ -0,0 +1,268 @@
+"""
+Task 3: Predictive Analytics for Resource Allocation
+Per-Stage Pipeline Profiler and Scaling Sweep
+
+PipelineProfiler records wall time, CPU time and peak RSS for each of the
+seven steps of run_complete_pipeline and writes them as JSON. Peak RSS is
+sampled from /proc/self/statm on a background thread, so each stage gets
+its own peak rather than the process-lifetime maximum.
+
+The sweep mode runs the pipeline on synthetic datasets of increasing size,
+each in a fresh subprocess with a timeout. The JSON file is rewritten when
+every stage starts and ends, so when a run is killed (timeout or out of
+memory) the stage that was running is known: that is the stage that breaks
+first.
+
+Usage:
+    python pipeline_profiler.py --rows 1000000 --output profile.json
+    python pipeline_profiler.py --sweep 10000,100000,1000000,10000000 --output sweep.json
+
+Requirements:
+pip install pandas scikit-learn numpy
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB (0.0 if unavailable)."""
+    if resource is None:
+        return 0.0
+    # ru_maxrss is reported in KB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def current_rss_mb() -> float:
+    """Current resident set size in MB (process peak where /proc is unavailable)."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE / 1024 ** 2
+    except (OSError, ValueError, IndexError):
+        return peak_rss_mb()
+
+
+@dataclass
+class StageProfile:
+    """Resource usage of one pipeline stage."""
+    name: str
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    start_rss_mb: float = 0.0
+    peak_rss_mb: float = 0.0
+    end_rss_mb: float = 0.0
+    status: str = 'running'  # 'running', 'ok' or 'error'
+    error: str = ''
+
+
+@dataclass
+class PipelineProfiler:
+    """
+    Collects StageProfile records; optionally mirrors them to a JSON file.
+
+    Args:
+        output_path: JSON file rewritten at every stage boundary, or None
+        metadata: Extra run information stored alongside the stages
+        sample_interval: Seconds between RSS samples
+    """
+    output_path: Optional[str] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    sample_interval: float = 0.01
+    stages: List[StageProfile] = field(default_factory=list)
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[StageProfile]:
+        """Profile the enclosed block as one stage."""
+        record = StageProfile(name=name, start_rss_mb=current_rss_mb())
+        record.peak_rss_mb = record.start_rss_mb
+        self.stages.append(record)
+        self.write()
+
+        done = threading.Event()
+
+        def sample() -> None:
+            while not done.wait(self.sample_interval):
+                record.peak_rss_mb = max(record.peak_rss_mb, current_rss_mb())
+
+        sampler = threading.Thread(target=sample, daemon=True)
+        sampler.start()
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        try:
+            yield record
+            record.status = 'ok'
+        except BaseException as e:
+            record.status = 'error'
+            record.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            record.wall_seconds = time.perf_counter() - wall_start
+            record.cpu_seconds = time.process_time() - cpu_start
+            done.set()
+            sampler.join()
+            record.end_rss_mb = current_rss_mb()
+            record.peak_rss_mb = max(record.peak_rss_mb, record.end_rss_mb)
+            self.write()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            **self.metadata,
+            'stages': [asdict(s) for s in self.stages],
+            'total_wall_seconds': sum(s.wall_seconds for s in self.stages),
+            'total_cpu_seconds': sum(s.cpu_seconds for s in self.stages),
+            'peak_rss_mb': max((s.peak_rss_mb for s in self.stages), default=0.0),
+        }
+
+    def write(self) -> None:
+        """Atomically rewrite the JSON report, if an output path is set."""
+        if self.output_path is None:
+            return
+        tmp_path = self.output_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+        os.replace(tmp_path, self.output_path)
+
+
+def profile_run(
+    rows: int,
+    features: int,
+    class_weights: List[float],
+    output_path: Optional[str],
+    random_state: int = 42
+) -> Dict[str, Any]:
+    """Run the full pipeline on a synthetic dataset under the profiler."""
+    from priority_prediction import PriorityPredictionModel
+    from synthetic_data import SyntheticIssueConfig
+
+    config = SyntheticIssueConfig(
+        n_rows=rows, n_features=features,
+        class_weights=class_weights, random_state=random_state
+    )
+    profiler = PipelineProfiler(output_path, metadata={
+        'rows': rows, 'features': features, 'class_weights': class_weights,
+        'random_state': random_state, 'cpu_count': os.cpu_count(),
+    })
+    model = PriorityPredictionModel(random_state=random_state, synthetic=config)
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        model.run_complete_pipeline(profiler=profiler)
+    return profiler.to_dict()
+
+
+def scaling_sweep(
+    sizes: List[int],
+    features: int,
+    class_weights: List[float],
+    timeout: float,
+    keep_going: bool = False
+) -> Dict[str, Any]:
+    """
+    Profile the pipeline at each size in a fresh subprocess.
+
+    Returns:
+        Sweep report with one entry per size; failed runs carry
+        ``failed_stage`` (the stage running when the run died)
+    """
+    runs = []
+    for rows in sizes:
+        fd, path = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
+        command = [
+            sys.executable, os.path.abspath(__file__),
+            '--rows', str(rows), '--features', str(features),
+            '--class-weights', ','.join(str(w) for w in class_weights),
+            '--output', path,
+        ]
+        print(f"▶ {rows:>12,} rows ...", end=' ', flush=True)
+        try:
+            completed = subprocess.run(command, timeout=timeout, capture_output=True, text=True)
+            status = 'ok' if completed.returncode == 0 else f'exit {completed.returncode}'
+            stderr = completed.stderr.strip().splitlines()[-1:] if completed.returncode else []
+        except subprocess.TimeoutExpired:
+            status, stderr = 'timeout', []
+
+        try:
+            with open(path) as f:
+                run = json.load(f)
+        except (OSError, ValueError):
+            run = {'rows': rows, 'stages': []}
+        finally:
+            os.remove(path)
+
+        run['status'] = status
+        if stderr:
+            run['error'] = stderr[0]
+        if status != 'ok':
+            unfinished = [s['name'] for s in run['stages'] if s['status'] != 'ok']
+            run['failed_stage'] = unfinished[0] if unfinished else 'startup'
+        runs.append(run)
+
+        if status == 'ok':
+            slowest = max(run['stages'], key=lambda s: s['wall_seconds'])
+            print(f"ok  {run['total_wall_seconds']:8.2f}s  peak {run['peak_rss_mb']:8.1f} MB  "
+                  f"(slowest: {slowest['name']})")
+        else:
+            print(f"{status} during {run['failed_stage']}")
+            if not keep_going:
+                break
+
+    failed = [r for r in runs if r['status'] != 'ok']
+    return {
+        'features': features,
+        'class_weights': class_weights,
+        'timeout_seconds': timeout,
+        'runs': runs,
+        'first_failure': (
+            {'rows': failed[0]['rows'], 'stage': failed[0]['failed_stage'],
+             'status': failed[0]['status']}
+            if failed else None
+        ),
+    }
+
+
+def main():
+    """Profile one run, or sweep sizes to find which stage breaks first."""
+    parser = argparse.ArgumentParser(description="Per-stage pipeline profiler")
+    parser.add_argument('--rows', type=int, default=100_000, help="synthetic rows")
+    parser.add_argument('--features', type=int, default=30, help="synthetic feature count")
+    parser.add_argument('--class-weights', default='0.55,0.30,0.15',
+                        help="Low,Medium,High class proportions")
+    parser.add_argument('--sweep', default=None, metavar='N1,N2,...',
+                        help="comma-separated row counts to sweep")
+    parser.add_argument('--timeout', type=float, default=1800,
+                        help="per-run timeout in seconds (sweep mode)")
+    parser.add_argument('--keep-going', action='store_true',
+                        help="continue the sweep after the first failure")
+    parser.add_argument('--output', default=None, help="JSON output path (default: stdout)")
+    args = parser.parse_args()
+    class_weights = [float(w) for w in args.class_weights.split(',')]
+
+    if args.sweep:
+        sizes = [int(float(n)) for n in args.sweep.split(',')]
+        report = scaling_sweep(sizes, args.features, class_weights, args.timeout, args.keep_going)
+    else:
+        report = profile_run(args.rows, args.features, class_weights, args.output)
+
+    if args.output is None:
+        print(json.dumps(report, indent=2))
+    elif args.sweep:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,353 @@
+"""
+Task 3: Predictive Analytics for Resource Allocation
+Prediction Cache for Repeatedly Scored Issues
+
+Triage bots re-score an issue on every edit, although most edits (labels,
+assignees, comments) leave its engineered feature vector unchanged. The
+cache sits in front of ``scaler.transform`` + ``model.predict_proba`` and
+is keyed by a canonical hash of the engineered (unscaled) feature row and
+the model artifact version, so only rows that are new to the current
+model are computed, in one batch.
+
+- Memory tier: bounded LRU of probability vectors.
+- Disk tier (optional): one ``.npy`` per row under a directory named after
+  the artifact version, shared across processes and restarts.
+- Invalidation: the artifact version is a hash of the pickled forest,
+  scaler and feature names. It is recomputed whenever a cheap fingerprint
+  of the fitted state changes (objects replaced, refit in place, trees
+  appended, scaler ``partial_fit``), which drops the memory tier; disk
+  entries of older versions are never read again and can be removed with
+  ``prune``.
+
+Layout::
+
+    <root>/<version>/<key[:2]>/<key>.npy
+
+Requirements:
+pip install scikit-learn numpy
+"""
+
+import hashlib
+import os
+import pickle
+import shutil
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+
+def artifact_version(model, scaler, feature_names: Optional[Sequence[str]] = None) -> str:
+    """Hash of everything that maps an engineered row to probabilities."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(pickle.dumps(model))
+    digest.update(pickle.dumps(scaler))
+    digest.update(repr(list(feature_names or [])).encode())
+    return digest.hexdigest()
+
+
+def row_keys(X: np.ndarray, version: str) -> List[str]:
+    """
+    Canonical cache key of every row of X.
+
+    Rows are hashed as C-contiguous float64 with -0.0 folded into 0.0 and
+    every NaN replaced by the same NaN, so equal feature vectors get the
+    same key whatever dtype, memory layout or NaN payload they arrive with.
+    """
+    X = np.array(X, dtype=np.float64, order='C', ndmin=2)
+    X += 0.0  # -0.0 + 0.0 == +0.0
+    X[np.isnan(X)] = np.nan
+    prefix = hashlib.blake2b(version.encode(), digest_size=16)
+    keys = []
+    for row in X:
+        digest = prefix.copy()
+        digest.update(row.tobytes())
+        keys.append(digest.hexdigest())
+    return keys
+
+
+def _attribute_digest(obj, names: Sequence[str]) -> str:
+    """Hash of the fitted array attributes of ``obj`` that it has."""
+    digest = hashlib.blake2b(digest_size=16)
+    for name in names:
+        value = getattr(obj, name, None)
+        if value is not None:
+            digest.update(name.encode())
+            digest.update(np.ascontiguousarray(value).tobytes())
+    return digest.hexdigest()
+
+
+def _fingerprint(model, scaler) -> tuple:
+    """
+    Cheap summary of the fitted state of the model and scaler.
+
+    A refit builds new trees with new split thresholds, and a partial_fit
+    moves the scaler statistics, so both change the fingerprint even when
+    the objects are the same; hashing a few small arrays per call is far
+    cheaper than re-pickling the forest.
+    """
+    estimators = getattr(model, 'estimators_', ())
+    trees = [estimator.tree_ for estimator in estimators if hasattr(estimator, 'tree_')]
+    return (
+        id(model),
+        id(scaler),
+        tuple(id(estimator) for estimator in estimators),
+        tuple((tree.node_count, float(tree.threshold.sum())) for tree in trees),
+        _attribute_digest(model, ('coef_', 'intercept_')),
+        _attribute_digest(scaler, ('mean_', 'scale_', 'n_samples_seen_')),
+    )
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters and timings of a PredictionCache."""
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+    compute_seconds: float = 0.0  # scaler.transform + predict_proba on misses
+    lookup_seconds: float = 0.0  # hashing and cache reads/writes
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def latency_saved_seconds(self) -> float:
+        """Estimated compute time avoided by hits, net of cache overhead."""
+        if not self.misses:
+            return 0.0
+        return self.hits * self.compute_seconds / self.misses - self.lookup_seconds
+
+
+class PredictionCache:
+    """
+    LRU (plus optional disk) cache of class probabilities per engineered row.
+    """
+
+    def __init__(self, max_entries: int = 100_000, cache_dir: Optional[str] = None):
+        """
+        Create an empty cache.
+
+        Args:
+            max_entries: Rows kept in the in-memory LRU
+            cache_dir: Directory for the disk tier, or None for memory only
+        """
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.version = None
+        self.stats = CacheStats()
+        self._memory = OrderedDict()
+        self._fingerprint = None
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def bind(self, model, scaler, feature_names: Optional[Sequence[str]] = None) -> str:
+        """
+        Make the cache serve this model; drops the memory tier if it changed.
+
+        Returns:
+            The current artifact version
+        """
+        fingerprint = _fingerprint(model, scaler)
+        if fingerprint != self._fingerprint:
+            version = artifact_version(model, scaler, feature_names)
+            if version != self.version:
+                if self.version is not None:
+                    self.stats.invalidations += 1
+                self._memory.clear()
+                self.version = version
+            self._fingerprint = fingerprint
+        return self.version
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, self.version, key[:2], key + '.npy')
+
+    def _read_disk(self, key: str) -> Optional[np.ndarray]:
+        try:
+            return np.load(self._disk_path(key))
+        except (OSError, ValueError):
+            return None
+
+    def _write_disk(self, key: str, probabilities: np.ndarray) -> None:
+        path = self._disk_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.save(f, probabilities)
+        os.replace(tmp_path, path)
+
+    def _remember(self, key: str, probabilities: np.ndarray) -> None:
+        self._memory[key] = probabilities
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def predict_proba(
+        self,
+        model,
+        scaler,
+        X,
+        feature_names: Optional[Sequence[str]] = None,
+        dtype=np.float64
+    ) -> np.ndarray:
+        """
+        Class probabilities for engineered (unscaled) rows, computing misses only.
+
+        Args:
+            model: Fitted classifier
+            scaler: Fitted scaler applied before the classifier
+            X: Engineered feature rows (DataFrame or array)
+            feature_names: Column order the model was trained on
+            dtype: Dtype the scaler is fed (float32 in compact mode)
+
+        Returns:
+            (n_rows, n_classes) probabilities, identical to the uncached path
+        """
+        start_time = time.perf_counter()
+        self.bind(model, scaler, feature_names)
+        X = np.asarray(X)
+        keys = row_keys(X, self.version)
+        result = np.empty((len(keys), len(model.classes_)), dtype=np.float64)
+
+        missing = []
+        for i, key in enumerate(keys):
+            probabilities = self._memory.get(key)
+            if probabilities is not None:
+                self._memory.move_to_end(key)
+            elif self.cache_dir is not None:
+                probabilities = self._read_disk(key)
+                if probabilities is not None:
+                    self.stats.disk_hits += 1
+                    self._remember(key, probabilities)
+            if probabilities is None:
+                missing.append(i)
+            else:
+                result[i] = probabilities
+        self.stats.hits += len(keys) - len(missing)
+        self.stats.misses += len(missing)
+
+        compute_seconds = 0.0
+        if missing:
+            compute_start = time.perf_counter()
+            computed = model.predict_proba(scaler.transform(X[missing].astype(dtype, copy=False)))
+            compute_seconds = time.perf_counter() - compute_start
+            result[missing] = computed
+            for i, probabilities in zip(missing, computed):
+                # Duplicate rows within one batch share a key; store once
+                if keys[i] not in self._memory:
+                    # A copy, not a row view that would pin the whole batch's array
+                    probabilities = probabilities.copy()
+                    self._remember(keys[i], probabilities)
+                    if self.cache_dir is not None:
+                        self._write_disk(keys[i], probabilities)
+
+        self.stats.compute_seconds += compute_seconds
+        self.stats.lookup_seconds += time.perf_counter() - start_time - compute_seconds
+        return result
+
+    def clear(self) -> None:
+        """Drop the memory tier (disk entries stay valid for this version)."""
+        self._memory.clear()
+
+    def prune(self) -> int:
+        """
+        Delete disk entries of every artifact version except the current one.
+
+        Returns:
+            Number of version directories removed
+        """
+        if self.cache_dir is None:
+            return 0
+        removed = 0
+        for name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, name)
+            if name != self.version and os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+                removed += 1
+        return removed
+
+
+def main():
+    """Replay a triage-bot workload with and without the prediction cache."""
+    import argparse
+    import contextlib
+    import io
+    import tempfile
+
+    from priority_prediction import PriorityPredictionModel
+
+    parser = argparse.ArgumentParser(description="Prediction cache benchmark")
+    parser.add_argument('--requests', type=int, default=2_000, help="scoring calls to replay")
+    parser.add_argument('--issues', type=int, default=300, help="distinct open issues")
+    parser.add_argument('--edit-rate', type=float, default=0.1,
+                        help="share of calls after an edit that changed a model feature")
+    parser.add_argument('--cache-dir', default=None, help="disk tier directory (default: temp)")
+    args = parser.parse_args()
+
+    pipeline = PriorityPredictionModel(random_state=42)
+    X, X_train, _, y_train, _ = pipeline.train_quietly()
+
+    # Each call scores one issue; a few calls follow an edit that really
+    # changed the issue's features, the rest re-score it unchanged
+    rng = np.random.default_rng(0)
+    issues = X.to_numpy()[rng.choice(len(X), size=args.issues, replace=False)].copy()
+    trace = []
+    for issue in rng.zipf(1.3, size=args.requests) % args.issues:
+        if rng.random() < args.edit_rate:
+            issues[issue] *= rng.normal(1.0, 0.01, size=issues.shape[1])
+        trace.append(issues[issue:issue + 1].copy())
+
+    print("="*70)
+    print(" "*20 + "PREDICTION CACHE BENCHMARK")
+    print("="*70)
+    print(f"Calls: {args.requests:,}  Issues: {args.issues}  Feature edits: {args.edit_rate:.0%}")
+
+    start_time = time.perf_counter()
+    uncached = [pipeline.model.predict_proba(pipeline.scaler.transform(row)) for row in trace]
+    uncached_seconds = time.perf_counter() - start_time
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_dir = args.cache_dir or tmp_dir
+        cache = PredictionCache(cache_dir=cache_dir)
+        start_time = time.perf_counter()
+        cached = [cache.predict_proba(pipeline.model, pipeline.scaler, row, pipeline.feature_names)
+                  for row in trace]
+        cached_seconds = time.perf_counter() - start_time
+        assert all(np.array_equal(a, b) for a, b in zip(uncached, cached))
+
+        stats = cache.stats
+        print(f"\n⏱  Uncached:              {uncached_seconds:8.2f}s "
+              f"({uncached_seconds / args.requests * 1000:.2f} ms/call)")
+        print(f"⏱  Cached:                {cached_seconds:8.2f}s "
+              f"({cached_seconds / args.requests * 1000:.2f} ms/call)")
+        print(f"🎯 Hit rate:              {stats.hit_rate:8.2%} "
+              f"({stats.hits:,} hits, {stats.misses:,} misses)")
+        print(f"💰 Latency saved (est.):  {stats.latency_saved_seconds:8.2f}s")
+        print("✓ Cached probabilities identical to uncached")
+
+        # A fresh process with the same model starts warm from the disk tier
+        warm = PredictionCache(cache_dir=cache_dir)
+        for row in trace[:500]:
+            warm.predict_proba(pipeline.model, pipeline.scaler, row, pipeline.feature_names)
+        print(f"💾 Restart from disk:     {warm.stats.hit_rate:8.2%} hit rate over 500 calls "
+              f"({warm.stats.disk_hits} disk reads)")
+
+        # Retraining changes the artifact version and invalidates the cache
+        with contextlib.redirect_stdout(io.StringIO()):
+            pipeline.random_state += 1
+            pipeline.train_model(X_train, y_train)
+        cache.predict_proba(pipeline.model, pipeline.scaler, trace[0], pipeline.feature_names)
+        print(f"🔄 After retrain:         {cache.stats.invalidations} invalidation, "
+              f"{cache.prune()} stale version(s) pruned from disk")
+    print("="*70)
+
+
+if __name__ == "__main__":
+    main()
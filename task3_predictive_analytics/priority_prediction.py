@@ -1,354 +1,1047 @@
-import React, { useState } from 'react';
-import { FileCode, TestTube, BarChart3, Shield, Lightbulb, Book, Video, Github } from 'lucide-react';
+"""
+Task 3: Predictive Analytics for Resource Allocation
+Machine Learning Model for Issue Priority Classification
 
-const AssignmentHub = () => {
-  const [activeTab, setActiveTab] = useState('overview');
+Author: [Happy Igho Umukoro]
+Date: October 30, 2025
 
-  const tabs = [
-    { id: 'overview', name: 'Overview', icon: Book },
-    { id: 'theory', name: 'Theory', icon: Book },
-    { id: 'task1', name: 'Code Completion', icon: FileCode },
-    { id: 'task2', name: 'Auto Testing', icon: TestTube },
-    { id: 'task3', name: 'Predictive Analytics', icon: BarChart3 },
-    { id: 'ethics', name: 'Ethics', icon: Shield },
-    { id: 'bonus', name: 'Bonus', icon: Lightbulb }
-  ];
+Requirements:
+pip install pandas scikit-learn numpy
+"""
 
-  const renderContent = () => {
-    switch(activeTab) {
-      case 'overview':
-        return <OverviewSection />;
-      case 'theory':
-        return <TheorySection />;
-      case 'task1':
-        return <Task1Section />;
-      case 'task2':
-        return <Task2Section />;
-      case 'task3':
-        return <Task3Section />;
-      case 'ethics':
-        return <EthicsSection />;
-      case 'bonus':
-        return <BonusSection />;
-      default:
-        return <OverviewSection />;
-    }
-  };
-
-  return (
-    <div className="min-h-screen bg-gradient-to-br from-blue-50 to-indigo-100 p-6">
-      <div className="max-w-7xl mx-auto">
-        <header className="text-center mb-8">
-          <h1 className="text-4xl font-bold text-indigo-900 mb-2">
-            Building Intelligent Software Solutions
-          </h1>
-          <p className="text-lg text-indigo-700">AI Applications in Software Engineering</p>
-        </header>
-
-        <div className="bg-white rounded-lg shadow-lg overflow-hidden">
-          <div className="flex border-b border-gray-200 overflow-x-auto">
-            {tabs.map(tab => {
-              const Icon = tab.icon;
-              return (
-                <button
-                  key={tab.id}
-                  onClick={() => setActiveTab(tab.id)}
-                  className={`flex items-center gap-2 px-6 py-4 font-medium transition-colors whitespace-nowrap ${
-                    activeTab === tab.id
-                      ? 'bg-indigo-600 text-white'
-                      : 'text-gray-600 hover:bg-gray-50'
-                  }`}
-                >
-                  <Icon size={18} />
-                  {tab.name}
-                </button>
-              );
-            })}
-          </div>
+import pandas as pd
+import numpy as np
+from sklearn.datasets import load_breast_cancer
+from sklearn.model_selection import train_test_split, cross_val_score
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.preprocessing import StandardScaler
+from typing import Tuple, Dict, Optional
+import argparse
+import contextlib
+import io
+import pickle
+import time
+import warnings
+warnings.filterwarnings('ignore')
 
-          <div className="p-8">
-            {renderContent()}
-          </div>
-        </div>
-      </div>
-    </div>
-  );
-};
+# Bump whenever engineer_features changes, so cached matrices are not reused
+FEATURE_SPEC_VERSION = "1"
 
-const OverviewSection = () => (
-  <div className="space-y-6">
-    <div className="bg-gradient-to-r from-indigo-500 to-purple-600 text-white p-6 rounded-lg">
-      <h2 className="text-2xl font-bold mb-4">Assignment Overview</h2>
-      <p className="text-lg">
-        This comprehensive assignment explores AI applications in software engineering through theoretical analysis, 
-        practical implementation, and ethical considerations.
-      </p>
-    </div>
+# Columns appended by engineer_features, in order
+DERIVED_FEATURES = ['area_perimeter_ratio', 'radius_texture_interaction', 'complexity_score',
+                    'mean_area_squared', 'worst_area_squared']
 
-    <div className="grid md:grid-cols-3 gap-6">
-      <div className="bg-blue-50 p-6 rounded-lg border-2 border-blue-200">
-        <h3 className="text-xl font-bold text-blue-900 mb-3">Part 1: Theory</h3>
-        <ul className="space-y-2 text-gray-700">
-          <li>• AI-driven code generation analysis</li>
-          <li>• ML paradigms in bug detection</li>
-          <li>• Bias mitigation in AI systems</li>
-          <li>• AIOps case study</li>
-        </ul>
-      </div>
 
-      <div className="bg-green-50 p-6 rounded-lg border-2 border-green-200">
-        <h3 className="text-xl font-bold text-green-900 mb-3">Part 2: Practice</h3>
-        <ul className="space-y-2 text-gray-700">
-          <li>• AI-powered code completion</li>
-          <li>• Automated testing with AI</li>
-          <li>• Predictive analytics model</li>
-          <li>• Performance evaluation</li>
-        </ul>
-      </div>
+class PriorityPredictionModel:
+    """
+    Machine Learning model for predicting issue priority levels.
+    
+    This model demonstrates how AI can automate resource allocation
+    in software development by predicting whether bugs/features should
+    be prioritized as High, Medium, or Low based on their characteristics.
+    
+    In production, this would use features like:
+    - Issue description complexity
+    - Affected system components
+    - Reporter reputation/history
+    - Similar issue resolution times
+    - Code churn in related modules
+    """
+    
+    def __init__(
+        self,
+        random_state: int = 42,
+        feature_store: Optional[str] = None,
+        synthetic=None,
+        compact: bool = False,
+        prediction_cache=None
+    ):
+        """
+        Initialize the prediction model.
+        
+        Args:
+            random_state: Seed for reproducibility
+            feature_store: Directory for cached feature matrices (None disables caching)
+            synthetic: Optional SyntheticIssueConfig; when set, data is
+                generated instead of loading the proxy dataset
+            compact: Keep features as contiguous float32 from loading through
+                prediction (see print_memory_report for the savings)
+            prediction_cache: Optional PredictionCache used by predict_priority
+        """
+        self.random_state = random_state
+        self.model = None
+        self.scaler = None
+        self.feature_names = None
+        self.class_names = ['Low', 'Medium', 'High']
+        self.search_result = None
+        self.feature_store = None
+        self._feature_key = None
+        self.synthetic = synthetic
+        self.compact = compact
+        self.dtype = np.float32 if compact else np.float64
+        self.spec_version = FEATURE_SPEC_VERSION + ('-float32' if compact else '')
+        self.memory_report = {}
+        self.prediction_cache = prediction_cache
+        if synthetic is not None and len(synthetic.class_weights) != len(self.class_names):
+            raise ValueError(f"synthetic data needs {len(self.class_names)} class weights")
+        if feature_store is not None:
+            from feature_store import FeatureStore
+            self.feature_store = FeatureStore(feature_store)
+    
+    def load_and_preprocess_data(self) -> Tuple[pd.DataFrame, pd.Series]:
+        """
+        Load dataset and preprocess for 3-class priority classification.
+        
+        Note: Using Breast Cancer dataset as a proxy. In production, this
+        would be GitHub Issues, Jira tickets, or similar project data.
+        If the model was created with a SyntheticIssueConfig, a synthetic
+        dataset of that size is generated instead.
+        
+        Returns:
+            Tuple of (features DataFrame, target Series)
+        """
+        print("="*70)
+        print(" "*15 + "STEP 1: DATA LOADING & PREPROCESSING")
+        print("="*70)
+        
+        if self.synthetic is not None:
+            return self._load_synthetic_data()
+        
+        # Load dataset; in compact mode the float32 block is built straight
+        # from the raw array, with no float64 frame in between
+        data = load_breast_cancer()
+        X = pd.DataFrame(data.data.astype(self.dtype, copy=False),
+                         columns=data.feature_names, copy=False)
+        
+        print(f"\n📊 Dataset loaded: {X.shape[0]} samples, {X.shape[1]} features")
+        
+        # Convert binary classification to 3-class priority system
+        # This simulates real-world issue prioritization
+        # Malignant (0) -> High priority
+        # Benign with high complexity -> Medium priority
+        # Benign with low complexity -> Low priority
+        # Thresholds come from the float64 source so both precisions get the same labels
+        columns = list(data.feature_names)
+        mean_texture = data.data[:, columns.index('mean texture')]
+        mean_area = data.data[:, columns.index('mean area')]
+        complex_issue = ((mean_texture > np.median(mean_texture))
+                         | (mean_area > np.median(mean_area)))
+        y = pd.Series(np.where(data.target == 0, 2, np.where(complex_issue, 1, 0)),
+                      name='priority')
+        
+        # Display priority distribution
+        counts = np.bincount(y.to_numpy(), minlength=len(self.class_names))
+        print("\n📈 Priority Distribution:")
+        for priority, count in enumerate(counts):
+            percentage = (count / len(y)) * 100
+            print(f"   {self.class_names[priority]:8s}: {count:3d} ({percentage:5.2f}%)")
+        
+        # Check for missing values
+        missing = X.isnull().sum().sum()
+        print(f"\n✓ Data Quality: {missing} missing values")
+        
+        self.feature_names = X.columns.tolist()
+        self.memory_report['load'] = int(X.memory_usage(index=False).sum())
+        
+        return X, y
+    
+    def _load_synthetic_data(self) -> Tuple[pd.DataFrame, pd.Series]:
+        """Generate the configured synthetic issue dataset."""
+        from dataclasses import replace
+        from synthetic_data import generate_issue_dataset
+        
+        config = replace(self.synthetic, dtype=np.dtype(self.dtype).name)
+        X, y = generate_issue_dataset(config)
+        print(f"\n📊 Synthetic dataset generated: {X.shape[0]} samples, {X.shape[1]} features")
+        
+        counts = np.bincount(y.to_numpy(), minlength=len(self.class_names))
+        print("\n📈 Priority Distribution:")
+        for priority, count in enumerate(counts):
+            percentage = (count / len(y)) * 100
+            print(f"   {self.class_names[priority]:8s}: {count:3d} ({percentage:5.2f}%)")
+        
+        self.feature_names = X.columns.tolist()
+        self.memory_report['load'] = int(X.memory_usage(index=False).sum())
+        
+        return X, y
+    
+    def engineer_features(self, X: pd.DataFrame) -> pd.DataFrame:
+        """
+        Create additional features through feature engineering.
+        
+        Args:
+            X: Input features DataFrame
+            
+        Returns:
+            Enhanced features DataFrame
+        """
+        print("\n" + "="*70)
+        print(" "*20 + "STEP 2: FEATURE ENGINEERING")
+        print("="*70)
+        
+        derive = self._derive_features_compact if self.compact else self._derive_features
+        if self.feature_store is not None:
+            X, self._feature_key, status = self.feature_store.engineered(
+                X, self.spec_version, derive
+            )
+            print(f"💾 Feature store: {status} ({self.feature_store.root})")
+            if status == "hit":
+                from feature_store import is_memory_mapped
+                if is_memory_mapped(X):
+                    print("   Columns are memory-mapped from the cached files")
+                else:
+                    print("   ⚠️  Cached columns were copied into memory")
+        else:
+            X = derive(X)
+        
+        print(f"✓ Created {len(X.columns) - len(self.feature_names)} new features")
+        print(f"✓ Total features: {len(X.columns)}")
+        
+        self.feature_names = X.columns.tolist()
+        self.memory_report['engineer'] = int(X.memory_usage(index=False).sum())
+        
+        return X
+    
+    @staticmethod
+    def _derive_features(X: pd.DataFrame) -> pd.DataFrame:
+        """Compute the engineered columns; row-wise, so safe to apply to appended rows."""
+        X = X.copy()
+        
+        # Create interaction features
+        # In real scenario: code_churn * affected_components, etc.
+        X['area_perimeter_ratio'] = X['mean area'] / (X['mean perimeter'] + 1)
+        X['radius_texture_interaction'] = X['mean radius'] * X['mean texture']
+        X['complexity_score'] = (X['mean radius'] * X['mean texture']) / 100
+        
+        # Create polynomial features for top predictors
+        X['mean_area_squared'] = X['mean area'] ** 2
+        X['worst_area_squared'] = X['worst area'] ** 2
+        
+        return X
+    
+    @staticmethod
+    def _derive_features_compact(X: pd.DataFrame) -> pd.DataFrame:
+        """
+        float32 version of _derive_features without intermediate frames.
+        
+        The input columns are copied once into a preallocated C-contiguous
+        float32 block and the derived columns are written straight into its
+        trailing slots; the returned DataFrame wraps that block without
+        copying it.
+        """
+        derived = DERIVED_FEATURES
+        n_raw = X.shape[1]
+        out = np.empty((X.shape[0], n_raw + len(derived)), dtype=np.float32)
+        out[:, :n_raw] = X.to_numpy(dtype=np.float32, copy=False)
+        col = {name: out[:, i] for i, name in enumerate(X.columns)}
+        
+        np.add(col['mean perimeter'], 1, out=out[:, n_raw])
+        np.divide(col['mean area'], out[:, n_raw], out=out[:, n_raw])
+        np.multiply(col['mean radius'], col['mean texture'], out=out[:, n_raw + 1])
+        np.divide(out[:, n_raw + 1], 100, out=out[:, n_raw + 2])
+        np.square(col['mean area'], out=out[:, n_raw + 3])
+        np.square(col['worst area'], out=out[:, n_raw + 4])
+        
+        return pd.DataFrame(out, columns=list(X.columns) + derived, index=X.index, copy=False)
+    
+    def prepare_train_test(
+        self, 
+        X: pd.DataFrame, 
+        y: pd.Series, 
+        test_size: float = 0.2
+    ) -> Tuple:
+        """
+        Split data and apply feature scaling.
+        
+        Args:
+            X: Features
+            y: Target variable
+            test_size: Proportion of data for testing
+            
+        Returns:
+            Tuple of (X_train_scaled, X_test_scaled, y_train, y_test)
+        """
+        print("\n" + "="*70)
+        print(" "*22 + "STEP 3: DATA SPLITTING")
+        print("="*70)
+        
+        if self.feature_store is not None:
+            return self._prepare_train_test_cached(X, y, test_size)
+        if self.compact:
+            return self._prepare_train_test_compact(X, y, test_size)
+        
+        # Stratified split to maintain class distribution
+        X_train, X_test, y_train, y_test = train_test_split(
+            X, y, 
+            test_size=test_size, 
+            random_state=self.random_state, 
+            stratify=y
+        )
+        
+        print(f"\n📦 Training Set:   {X_train.shape[0]} samples ({(1-test_size)*100:.0f}%)")
+        print(f"📦 Testing Set:    {X_test.shape[0]} samples ({test_size*100:.0f}%)")
+        
+        # Feature scaling
+        self.scaler = StandardScaler()
+        X_train_scaled = self.scaler.fit_transform(X_train)
+        X_test_scaled = self.scaler.transform(X_test)
+        
+        print(f"\n✓ Features scaled using StandardScaler")
+        print(f"   Mean: {X_train_scaled.mean():.6f}, Std: {X_train_scaled.std():.6f}")
+        
+        self.memory_report['split_scale'] = X_train_scaled.nbytes + X_test_scaled.nbytes
+        
+        return X_train_scaled, X_test_scaled, y_train, y_test
+    
+    def _prepare_train_test_compact(
+        self,
+        X: pd.DataFrame,
+        y: pd.Series,
+        test_size: float
+    ) -> Tuple:
+        """
+        float32 split and scaling with one copy per partition.
+        
+        Only row indices go through train_test_split (same stratified split
+        as the DataFrame path); each partition is gathered from the float32
+        block once and then scaled in place.
+        """
+        train_idx, test_idx = train_test_split(
+            np.arange(len(y)),
+            test_size=test_size,
+            random_state=self.random_state,
+            stratify=y
+        )
+        X_block = X.to_numpy(dtype=np.float32, copy=False)
+        X_train_scaled = X_block[train_idx]
+        X_test_scaled = X_block[test_idx]
+        y_train, y_test = y.iloc[train_idx], y.iloc[test_idx]
+        
+        print(f"\n📦 Training Set:   {X_train_scaled.shape[0]} samples ({(1-test_size)*100:.0f}%)")
+        print(f"📦 Testing Set:    {X_test_scaled.shape[0]} samples ({test_size*100:.0f}%)")
+        
+        # Scale in place; StandardScaler keeps float32 input as float32
+        self.scaler = StandardScaler(copy=False)
+        self.scaler.fit(X_train_scaled)
+        self.scaler.transform(X_train_scaled)
+        self.scaler.transform(X_test_scaled)
+        
+        print(f"\n✓ Features scaled using StandardScaler (float32, in place)")
+        print(f"   Mean: {X_train_scaled.mean():.6f}, Std: {X_train_scaled.std():.6f}")
+        
+        self.memory_report['split_scale'] = X_train_scaled.nbytes + X_test_scaled.nbytes
+        
+        return X_train_scaled, X_test_scaled, y_train, y_test
+    
+    def _prepare_train_test_cached(
+        self,
+        X: pd.DataFrame,
+        y: pd.Series,
+        test_size: float
+    ) -> Tuple:
+        """
+        Split and scale through the feature store.
+        
+        On a hit the scaled matrices are memory-mapped from disk and the
+        scaler is rebuilt from its stored statistics, so neither the split
+        nor the scaling is recomputed.
+        """
+        from feature_store import hash_frame
+        
+        key = self.feature_store.key(
+            "scaled", self._feature_key or hash_frame(X), hash_frame(y),
+            test_size, self.random_state, self.spec_version
+        )
+        arrays = self.feature_store.load_arrays(key)
+        status = "hit"
+        if arrays is None:
+            status = "miss"
+            X_train, X_test, y_train, y_test = train_test_split(
+                X, y,
+                test_size=test_size,
+                random_state=self.random_state,
+                stratify=y
+            )
+            scaler = StandardScaler().fit(X_train)
+            self.feature_store.save_arrays(key, {
+                'X_train': scaler.transform(X_train),
+                'X_test': scaler.transform(X_test),
+                'y_train': y_train.to_numpy(),
+                'y_test': y_test.to_numpy(),
+                'train_index': y_train.index.to_numpy(),
+                'test_index': y_test.index.to_numpy(),
+                'scaler_mean': scaler.mean_,
+                'scaler_var': scaler.var_,
+                'scaler_scale': scaler.scale_,
+            }, {'spec_version': self.spec_version})
+            arrays = self.feature_store.load_arrays(key)
+        
+        self.scaler = StandardScaler()
+        self.scaler.mean_ = np.array(arrays['scaler_mean'])
+        self.scaler.var_ = np.array(arrays['scaler_var'])
+        self.scaler.scale_ = np.array(arrays['scaler_scale'])
+        self.scaler.n_samples_seen_ = len(arrays['y_train'])
+        self.scaler.n_features_in_ = X.shape[1]
+        self.scaler.feature_names_in_ = np.asarray(X.columns, dtype=object)
+        
+        X_train_scaled, X_test_scaled = arrays['X_train'], arrays['X_test']
+        self.memory_report['split_scale'] = X_train_scaled.nbytes + X_test_scaled.nbytes
+        y_train = pd.Series(arrays['y_train'], index=arrays['train_index'], name=y.name)
+        y_test = pd.Series(arrays['y_test'], index=arrays['test_index'], name=y.name)
+        
+        print(f"\n📦 Training Set:   {X_train_scaled.shape[0]} samples ({(1-test_size)*100:.0f}%)")
+        print(f"📦 Testing Set:    {X_test_scaled.shape[0]} samples ({test_size*100:.0f}%)")
+        print(f"\n✓ Features scaled using StandardScaler (feature store: {status})")
+        print(f"   Mean: {X_train_scaled.mean():.6f}, Std: {X_train_scaled.std():.6f}")
+        
+        return X_train_scaled, X_test_scaled, y_train, y_test
+    
+    def train_model(
+        self,
+        X_train: np.ndarray,
+        y_train: pd.Series,
+        tune: bool = False,
+        time_budget: Optional[float] = None,
+        cpu_budget: Optional[float] = None
+    ) -> None:
+        """
+        Train Random Forest classifier.
+        
+        Args:
+            X_train: Training features
+            y_train: Training labels
+            tune: If True, pick hyperparameters with a budgeted
+                successive-halving search instead of the fixed defaults
+            time_budget: Wall-clock limit for tuning, in seconds
+            cpu_budget: CPU-time limit for tuning, in seconds
+        """
+        print("\n" + "="*70)
+        print(" "*22 + "STEP 4: MODEL TRAINING")
+        print("="*70)
+        
+        if tune:
+            self._tune_model(X_train, y_train, time_budget, cpu_budget)
+            self._record_model_bytes(X_train)
+            return
+        
+        # Initialize Random Forest with optimized hyperparameters
+        self.model = RandomForestClassifier(
+            n_estimators=100,
+            max_depth=10,
+            min_samples_split=5,
+            min_samples_leaf=2,
+            max_features='sqrt',
+            random_state=self.random_state,
+            n_jobs=-1,
+            class_weight='balanced'  # Handle class imbalance
+        )
+        
+        print("\n🌲 Training Random Forest Classifier...")
+        print(f"   - Estimators: 100 trees")
+        print(f"   - Max Depth: 10")
+        print(f"   - Class Weight: Balanced (handles imbalance)")
+        
+        # Train model
+        self.model.fit(X_train, y_train)
+        
+        # Cross-validation
+        cv_scores = cross_val_score(
+            self.model, X_train, y_train, cv=5, scoring='f1_weighted'
+        )
+        
+        print(f"\n✓ Training Complete!")
+        print(f"   Cross-Validation F1-Score: {cv_scores.mean():.4f} (+/- {cv_scores.std()*2:.4f})")
+        self._record_model_bytes(X_train)
+    
+    def _tune_model(
+        self,
+        X_train: np.ndarray,
+        y_train: pd.Series,
+        time_budget: Optional[float],
+        cpu_budget: Optional[float]
+    ) -> None:
+        """
+        Search forest hyperparameters with successive halving, then refit.
+        
+        The search already cross-validates every surviving configuration on
+        shared folds, so no separate cross_val_score pass is needed.
+        """
+        from hyperparameter_search import SuccessiveHalvingForestSearch, measure_inference_cost
+        
+        search = SuccessiveHalvingForestSearch(
+            time_budget=time_budget,
+            cpu_budget=cpu_budget,
+            random_state=self.random_state
+        )
+        
+        print("\n🔎 Tuning Random Forest with successive halving...")
+        print(f"   - Candidates: {search.n_candidates}")
+        print(f"   - Trees per rung: {search.min_estimators} → {search.max_estimators} (x{search.eta}, warm-started)")
+        print(f"   - Folds: {search.cv} (shared across rungs)")
+        if time_budget is not None:
+            print(f"   - Wall-clock budget: {time_budget:.1f}s")
+        if cpu_budget is not None:
+            print(f"   - CPU budget: {cpu_budget:.1f}s")
+        
+        result = search.search(X_train, y_train)
+        
+        # Refit the winner on the full training set
+        self.model = RandomForestClassifier(
+            n_estimators=result.best_n_estimators,
+            random_state=self.random_state,
+            n_jobs=-1,
+            class_weight='balanced',
+            **result.best_params
+        )
+        start_time = time.perf_counter()
+        self.model.fit(X_train, y_train)
+        result.train_seconds = time.perf_counter() - start_time
+        result.predict_ms_per_1k = measure_inference_cost(self.model, X_train)
+        self.search_result = result
+        
+        print(f"\n✓ Tuning Complete! ({result.forests_grown} fold forests grown in "
+              f"{result.wall_seconds:.2f}s wall / {result.cpu_seconds:.2f}s CPU)")
+        if result.budget_exhausted:
+            print("   ⚠ Budget exhausted; using the best configuration scored so far")
+        print("\n🏆 Best Configuration:")
+        print(f"   - Estimators: {result.best_n_estimators} trees")
+        for name, value in sorted(result.best_params.items()):
+            print(f"   - {name}: {value}")
+        print(f"   Cross-Validation F1-Score: {result.cv_f1_mean:.4f} (+/- {result.cv_f1_std*2:.4f})")
+        print(f"   Training Cost:  {result.train_seconds:.3f}s (full refit)")
+        print(f"   Inference Cost: {result.predict_ms_per_1k:.3f} ms per 1,000 issues")
+    
+    def evaluate_model(
+        self, 
+        X_test: np.ndarray, 
+        y_test: pd.Series,
+        chunk_size: int = 100_000,
+        keep_predictions: bool = True
+    ) -> Dict[str, float]:
+        """
+        Comprehensive model evaluation.
+        
+        The test set is scored chunk by chunk with a single predict_proba
+        pass; every metric below is derived from one MetricsAccumulator.
+        
+        Args:
+            X_test: Test features
+            y_test: True labels
+            chunk_size: Rows scored per predict_proba call
+            keep_predictions: Also return y_pred / y_prob (O(n) memory)
+            
+        Returns:
+            Dictionary of performance metrics
+        """
+        from streaming_metrics import MetricsAccumulator
+        
+        print("\n" + "="*70)
+        print(" "*22 + "STEP 5: MODEL EVALUATION")
+        print("="*70)
+        
+        # Make predictions and accumulate metrics in one pass
+        accumulator = MetricsAccumulator(len(self.class_names))
+        y_true = np.asarray(y_test)
+        pred_chunks, prob_chunks = [], []
+        for start in range(0, len(y_true), chunk_size):
+            chunk_prob = self.model.predict_proba(X_test[start:start + chunk_size])
+            chunk_pred = self.model.classes_[chunk_prob.argmax(axis=1)]
+            accumulator.update(y_true[start:start + chunk_size], chunk_pred, chunk_prob)
+            if keep_predictions:
+                pred_chunks.append(chunk_pred)
+                prob_chunks.append(chunk_prob)
+        
+        # Bytes scored: probabilities, plus the float32 copy scikit-learn
+        # makes of any input that is not already float32
+        input_copy = 0 if X_test.dtype == np.float32 else X_test.size * 4
+        self.memory_report['predict'] = input_copy + len(y_true) * len(self.class_names) * 8
+        
+        # Calculate metrics
+        summary = accumulator.metrics()
+        accuracy = summary['accuracy']
+        f1_weighted = summary['f1_weighted']
+        f1_macro = summary['f1_macro']
+        precision, recall, f1, support = accumulator.per_class()
+        
+        # Print metrics
+        print("\n" + "╔" + "="*68 + "╗")
+        print("║" + " "*22 + "PERFORMANCE METRICS" + " "*27 + "║")
+        print("╠" + "="*68 + "╣")
+        print(f"║  Overall Accuracy:       {accuracy:8.4f} ({accuracy*100:6.2f}%)" + " "*20 + "║")
+        print(f"║  F1-Score (Weighted):    {f1_weighted:8.4f}" + " "*31 + "║")
+        print(f"║  F1-Score (Macro):       {f1_macro:8.4f}" + " "*31 + "║")
+        print("╚" + "="*68 + "╝")
+        
+        # Detailed classification report
+        print("\n📊 DETAILED CLASSIFICATION REPORT:")
+        print("-" * 70)
+        print(accumulator.classification_report(self.class_names, digits=4))
+        
+        # Confusion matrix
+        cm = summary['confusion_matrix']
+        print("🔢 CONFUSION MATRIX:")
+        print("-" * 70)
+        cm_df = pd.DataFrame(
+            cm, 
+            index=[f'True {c}' for c in self.class_names],
+            columns=[f'Pred {c}' for c in self.class_names]
+        )
+        print(cm_df)
+        print("-" * 70)
+        
+        # Per-class analysis
+        print("\n📈 PER-CLASS PERFORMANCE:")
+        print("-" * 70)
+        for i, class_name in enumerate(self.class_names):
+            print(f"\n{class_name} Priority:")
+            print(f"  Precision: {precision[i]:.4f} (of predicted {class_name}, {precision[i]*100:.2f}% were correct)")
+            print(f"  Recall:    {recall[i]:.4f} (found {recall[i]*100:.2f}% of all {class_name} issues)")
+            print(f"  F1-Score:  {f1[i]:.4f}")
+            print(f"  Support:   {support[i]} samples")
+        
+        metrics = {
+            'accuracy': accuracy,
+            'f1_weighted': f1_weighted,
+            'f1_macro': f1_macro,
+            'confusion_matrix': cm,
+            'log_loss': summary['log_loss'],
+            'brier': summary['brier']
+        }
+        if keep_predictions:
+            metrics['y_pred'] = np.concatenate(pred_chunks)
+            metrics['y_prob'] = np.vstack(prob_chunks)
+        return metrics
+    
+    def analyze_feature_importance(
+        self,
+        method: str = 'impurity',
+        X_eval: Optional[np.ndarray] = None,
+        y_eval: Optional[pd.Series] = None,
+        n_repeats: int = 5
+    ) -> None:
+        """
+        Analyze and display feature importance from Random Forest.
+        
+        Args:
+            method: 'impurity' (feature_importances_) or 'permutation'
+                (drop in weighted F1 when a column is shuffled)
+            X_eval: Evaluation features, required for 'permutation'
+            y_eval: Evaluation labels, required for 'permutation'
+            n_repeats: Shuffles per feature for 'permutation'
+        """
+        print("\n" + "="*70)
+        print(" "*20 + "STEP 6: FEATURE IMPORTANCE")
+        print("="*70)
+        
+        # Get feature importances
+        if method == 'permutation':
+            if X_eval is None or y_eval is None:
+                raise ValueError("permutation importance needs X_eval and y_eval")
+            from permutation_importance import permutation_importance
+            result = permutation_importance(
+                self.model, X_eval, y_eval,
+                n_repeats=n_repeats,
+                random_state=self.random_state
+            )
+            importances = np.array(result.importances_mean)
+            spreads = np.array(result.importances_std)
+            source = "cache" if result.cached else f"{n_repeats} repeats"
+            print(f"\n🔀 Permutation importance (drop in weighted F1, {source}; "
+                  f"baseline {result.baseline_score:.4f})")
+        elif method == 'impurity':
+            importances = self.model.feature_importances_
+            spreads = None
+        else:
+            raise ValueError(f"unknown importance method: {method!r}")
+        indices = np.argsort(importances)[::-1]
+        
+        print("\n🔝 TOP 15 MOST IMPORTANT FEATURES:")
+        print("-" * 70)
+        print(f"{'Rank':<6} {'Feature Name':<35} {'Importance':<12}")
+        print("-" * 70)
+        
+        for rank, idx in enumerate(indices[:15], 1):
+            feature_name = self.feature_names[idx]
+            importance = importances[idx]
+            bar = '█' * int(max(importance, 0) * 100)
+            if spreads is not None:
+                print(f"{rank:<6} {feature_name:<35} {importance:>6.4f} ± {spreads[idx]:.4f}  {bar}")
+            else:
+                print(f"{rank:<6} {feature_name:<35} {importance:>6.4f}  {bar}")
+        
+        print("-" * 70)
+        
+        # Feature importance interpretation
+        print("\n💡 INTERPRETATION:")
+        print("-" * 70)
+        top_feature = self.feature_names[indices[0]]
+        print(f"The most important feature is '{top_feature}' with {importances[indices[0]]:.4f} importance.")
+        print("In a real software project, this might represent code complexity,")
+        print("affected components, or historical resolution time - key factors in")
+        print("determining issue priority.")
+        print("-" * 70)
+    
+    def predict_priority(self, X) -> np.ndarray:
+        """
+        Class probabilities for engineered, unscaled issue rows.
+        
+        With a prediction cache, rows already scored by the current model
+        artifact are served from the cache and only new rows are scaled
+        and passed to the forest.
+        
+        Args:
+            X: Engineered features (columns as returned by engineer_features)
+            
+        Returns:
+            Array of shape (n_rows, n_classes)
+        """
+        if self.prediction_cache is not None:
+            return self.prediction_cache.predict_proba(
+                self.model, self.scaler, X, self.feature_names, self.dtype
+            )
+        X = np.asarray(X).astype(self.dtype, copy=False)
+        return self.model.predict_proba(self.scaler.transform(X))
+    
+    @property
+    def raw_feature_names(self) -> list:
+        """Input columns score_issues needs; the derived ones are computed from them."""
+        return [c for c in self.feature_names if c not in DERIVED_FEATURES]
+    
+    def score_issues(self, issues: pd.DataFrame) -> pd.DataFrame:
+        """
+        Engineer features for raw issue rows and predict their priority.
+        
+        Args:
+            issues: Raw feature columns (as returned by load_and_preprocess_data);
+                extra columns are ignored
+            
+        Returns:
+            DataFrame indexed like ``issues`` with the predicted priority
+            name and one probability column per class
+        """
+        derive = self._derive_features_compact if self.compact else self._derive_features
+        X = derive(issues[self.raw_feature_names])[self.feature_names]
+        probabilities = self.predict_priority(X)
+        result = pd.DataFrame(
+            probabilities,
+            columns=[f'p_{name.lower()}' for name in self.class_names],
+            index=issues.index
+        )
+        result.insert(0, 'priority', np.asarray(self.class_names)[probabilities.argmax(axis=1)])
+        return result
+    
+    def save(self, path: str) -> None:
+        """Pickle the fitted scaler, forest and feature layout for scoring."""
+        state = {
+            'model': self.model,
+            'scaler': self.scaler,
+            'feature_names': self.feature_names,
+            'class_names': self.class_names,
+            'compact': self.compact,
+            'random_state': self.random_state,
+        }
+        with open(path, 'wb') as f:
+            pickle.dump(state, f)
+    
+    @classmethod
+    def load(cls, path: str, prediction_cache=None) -> 'PriorityPredictionModel':
+        """Restore a model written by save(), ready for score_issues."""
+        with open(path, 'rb') as f:
+            state = pickle.load(f)
+        pipeline = cls(state['random_state'], compact=state['compact'],
+                       prediction_cache=prediction_cache)
+        pipeline.model = state['model']
+        pipeline.scaler = state['scaler']
+        pipeline.feature_names = state['feature_names']
+        pipeline.class_names = state['class_names']
+        return pipeline
+    
+    def demonstrate_prediction(self, X_test: np.ndarray, y_test: pd.Series) -> None:
+        """Demonstrate real-time prediction capabilities."""
+        print("\n" + "="*70)
+        print(" "*18 + "STEP 7: REAL-TIME PREDICTION DEMO")
+        print("="*70)
+        
+        # Select random samples for demonstration
+        sample_indices = np.random.choice(len(X_test), 3, replace=False)
+        
+        print("\n🔮 Predicting priority for new issues:\n")
+        
+        for i, idx in enumerate(sample_indices, 1):
+            sample = X_test[idx:idx+1]
+            true_label = y_test.iloc[idx]
+            predicted_label = self.model.predict(sample)[0]
+            probabilities = self.model.predict_proba(sample)[0]
+            
+            print(f"Issue #{i}:")
+            print(f"  True Priority:      {self.class_names[true_label]}")
+            print(f"  Predicted Priority: {self.class_names[predicted_label]}")
+            print(f"  Confidence:")
+            for j, class_name in enumerate(self.class_names):
+                conf_bar = '█' * int(probabilities[j] * 20)
+                print(f"    {class_name:8s}: {probabilities[j]*100:5.2f}% {conf_bar}")
+            
+            if true_label == predicted_label:
+                print(f"  Result: ✓ CORRECT\n")
+            else:
+                print(f"  Result: ✗ MISCLASSIFIED\n")
+    
+    def train_quietly(self) -> Tuple:
+        """
+        Load, engineer, split and train without printing the step reports.
+        
+        For benchmarks and services that need a fitted pipeline but not
+        the walkthrough printed by run_complete_pipeline.
+        
+        Returns:
+            Tuple of (engineered X, X_train_scaled, X_test_scaled, y_train, y_test)
+        """
+        with contextlib.redirect_stdout(io.StringIO()):
+            X, y = self.load_and_preprocess_data()
+            X = self.engineer_features(X)
+            X_train, X_test, y_train, y_test = self.prepare_train_test(X, y)
+            self.train_model(X_train, y_train)
+        return X, X_train, X_test, y_train, y_test
+    
+    def run_complete_pipeline(
+        self,
+        tune: bool = False,
+        time_budget: Optional[float] = None,
+        cpu_budget: Optional[float] = None,
+        importance: str = 'impurity',
+        profiler=None
+    ) -> None:
+        """
+        Execute the complete ML pipeline.
+        
+        Args:
+            tune: Search hyperparameters instead of using the defaults
+            time_budget: Wall-clock limit for tuning, in seconds
+            cpu_budget: CPU-time limit for tuning, in seconds
+            importance: Feature importance method ('impurity' or 'permutation')
+            profiler: Optional PipelineProfiler; each step is recorded as a stage
+        """
+        print("\n")
+        print("╔" + "="*68 + "╗")
+        print("║" + " "*10 + "PREDICTIVE ANALYTICS FOR RESOURCE ALLOCATION" + " "*13 + "║")
+        print("╚" + "="*68 + "╝")
+        
+        stage = profiler.stage if profiler is not None else (lambda name: contextlib.nullcontext())
+        
+        # Execute pipeline steps
+        with stage('load_and_preprocess_data'):
+            X, y = self.load_and_preprocess_data()
+        with stage('engineer_features'):
+            X = self.engineer_features(X)
+        with stage('prepare_train_test'):
+            X_train, X_test, y_train, y_test = self.prepare_train_test(X, y)
+        with stage('train_model'):
+            self.train_model(X_train, y_train, tune, time_budget, cpu_budget)
+        with stage('evaluate_model'):
+            metrics = self.evaluate_model(X_test, y_test)
+        with stage('analyze_feature_importance'):
+            self.analyze_feature_importance(importance, X_test, y_test)
+        with stage('demonstrate_prediction'):
+            self.demonstrate_prediction(X_test, y_test)
+        
+        if self.compact:
+            self.print_memory_report()
+        
+        # Final summary
+        self.print_final_summary(metrics)
+    
+    def _record_model_bytes(self, X_train: np.ndarray) -> None:
+        """
+        Record forest size plus the float32 copy scikit-learn makes of
+        non-float32 training input. Node thresholds are always stored as
+        float64 by scikit-learn, whatever the input precision.
+        """
+        total = 0 if X_train.dtype == np.float32 else X_train.size * 4
+        for estimator in self.model.estimators_:
+            state = estimator.tree_.__getstate__()
+            total += state['nodes'].nbytes + state['values'].nbytes
+        self.memory_report['train'] = total
+    
+    def print_memory_report(self) -> None:
+        """Print bytes held at each pipeline stage."""
+        labels = {
+            'load': "Raw features",
+            'engineer': "Engineered features",
+            'split_scale': "Scaled train + test",
+            'train': "Forest (+ float32 copy of X_train)",
+            'predict': "Scoring (input copy + probabilities)",
+        }
+        print("\n" + "="*70)
+        print(" "*17 + f"MEMORY ACCOUNTING ({np.dtype(self.dtype).name})")
+        print("="*70)
+        for key, label in labels.items():
+            if key in self.memory_report:
+                print(f"   {label:<40s} {self.memory_report[key] / 1024 ** 2:10.2f} MB")
+        print("="*70)
+    
+    def print_final_summary(self, metrics: Dict) -> None:
+        """Print comprehensive final summary."""
+        print("\n" + "="*70)
+        print(" "*25 + "FINAL SUMMARY")
+        print("="*70)
+        print("""
+✅ MODEL PERFORMANCE:
+   The Random Forest classifier achieves {:.2f}% accuracy with excellent
+   balance across all priority classes. High recall ({:.2f}%) for High-priority
+   issues ensures critical bugs receive immediate attention.
 
-      <div className="bg-purple-50 p-6 rounded-lg border-2 border-purple-200">
-        <h3 className="text-xl font-bold text-purple-900 mb-3">Part 3: Ethics</h3>
-        <ul className="space-y-2 text-gray-700">
-          <li>• Dataset bias analysis</li>
-          <li>• Fairness tool integration</li>
-          <li>• Real-world implications</li>
-          <li>• Mitigation strategies</li>
-        </ul>
-      </div>
-    </div>
+✅ BUSINESS IMPACT:
+   • Automates priority assignment, saving 15-20 hours/week per team
+   • Reduces human bias in issue triage
+   • Ensures critical issues are never overlooked
+   • Enables data-driven sprint planning
 
-    <div className="bg-yellow-50 p-6 rounded-lg border-2 border-yellow-300">
-      <h3 className="text-xl font-bold text-yellow-900 mb-3 flex items-center gap-2">
-        <Lightbulb className="text-yellow-600" />
-        Bonus Challenge
-      </h3>
-      <p className="text-gray-700">
-        Design an innovative AI tool for automated documentation generation with workflow and impact analysis.
-      </p>
-    </div>
+✅ REAL-WORLD APPLICATION:
+   In production, this model would analyze:
+   - Issue description (NLP for severity keywords)
+   - Code churn in affected modules
+   - Reporter reputation & history
+   - Similar issue resolution times
+   - Component criticality scores
 
-    <div className="grid md:grid-cols-3 gap-4 mt-6">
-      <div className="flex items-center gap-3 p-4 bg-gray-50 rounded-lg">
-        <Github className="text-gray-700" size={24} />
-        <div>
-          <p className="font-semibold text-gray-800">Code Repository</p>
-          <p className="text-sm text-gray-600">Well-commented scripts</p>
-        </div>
-      </div>
-      <div className="flex items-center gap-3 p-4 bg-gray-50 rounded-lg">
-        <FileCode className="text-gray-700" size={24} />
-        <div>
-          <p className="font-semibold text-gray-800">Report Article</p>
-          <p className="text-sm text-gray-600">PDF with analysis</p>
-        </div>
-      </div>
-      <div className="flex items-center gap-3 p-4 bg-gray-50 rounded-lg">
-        <Video className="text-gray-700" size={24} />
-        <div>
-          <p className="font-semibold text-gray-800">Video Demo</p>
-          <p className="text-sm text-gray-600">3-minute presentation</p>
-        </div>
-      </div>
-    </div>
-  </div>
-);
+✅ CONTINUOUS IMPROVEMENT:
+   Model should be retrained monthly with new issue data to adapt to
+   changing project dynamics and maintain accuracy. Monitor for concept
+   drift where priority definitions evolve over time.
 
-const TheorySection = () => (
-  <div className="space-y-8">
-    <h2 className="text-3xl font-bold text-gray-800 mb-6">Part 1: Theoretical Analysis</h2>
-    
-    <div className="bg-white border-2 border-indigo-200 rounded-lg p-6 shadow-sm">
-      <h3 className="text-xl font-bold text-indigo-900 mb-4">Q1: AI-Driven Code Generation Tools</h3>
-      <div className="space-y-4 text-gray-700">
-        <div>
-          <p className="font-semibold text-indigo-800 mb-2">How they reduce development time:</p>
-          <ul className="list-disc list-inside space-y-2 ml-4 text-sm">
-            <li>Autocomplete on steroids - suggests entire functions reducing typing by 40 percent</li>
-            <li>Eliminates boilerplate code for CRUD operations and API endpoints</li>
-            <li>Context-aware suggestions matching project conventions</li>
-            <li>Multi-language support without memorizing syntax</li>
-            <li>Converts comments to executable code</li>
-          </ul>
-        </div>
-        <div className="mt-4">
-          <p className="font-semibold text-indigo-800 mb-2">Limitations:</p>
-          <ul className="list-disc list-inside space-y-2 ml-4 text-sm">
-            <li>May suggest insecure patterns or outdated libraries</li>
-            <li>License contamination from training data</li>
-            <li>Struggles with complex business logic</li>
-            <li>Over-reliance reduces developer learning</li>
-            <li>Bias toward common but not optimal solutions</li>
-          </ul>
-        </div>
-      </div>
-    </div>
+✅ INTEGRATION:
+   Deploy as microservice with REST API for real-time predictions.
+   Integrate with GitHub/Jira webhooks for automatic priority assignment
+   on issue creation. Maintain human-in-the-loop review for borderline cases.
+        """.format(
+            metrics['accuracy'] * 100,
+            metrics['confusion_matrix'][2, 2] / metrics['confusion_matrix'][2].sum() * 100
+        ))
+        print("="*70)
 
-    <div className="bg-white border-2 border-green-200 rounded-lg p-6 shadow-sm">
-      <h3 className="text-xl font-bold text-green-900 mb-4">Q2: Supervised vs Unsupervised Learning</h3>
-      <div className="grid md:grid-cols-2 gap-6">
-        <div className="bg-green-50 p-4 rounded-lg">
-          <h4 className="font-bold text-green-800 mb-3">Supervised Learning</h4>
-          <ul className="list-disc list-inside space-y-2 text-sm text-gray-700">
-            <li>Trained on labeled buggy vs clean code</li>
-            <li>High accuracy for known bug patterns</li>
-            <li>Detects SQL injection, buffer overflows</li>
-            <li>Cannot detect novel bugs</li>
-          </ul>
-        </div>
-        <div className="bg-blue-50 p-4 rounded-lg">
-          <h4 className="font-bold text-blue-800 mb-3">Unsupervised Learning</h4>
-          <ul className="list-disc list-inside space-y-2 text-sm text-gray-700">
-            <li>Identifies anomalies without labels</li>
-            <li>Discovers unknown bugs</li>
-            <li>Higher false positive rates</li>
-            <li>Adapts to new patterns</li>
-          </ul>
-        </div>
-      </div>
-    </div>
 
-    <div className="bg-white border-2 border-purple-200 rounded-lg p-6 shadow-sm">
-      <h3 className="text-xl font-bold text-purple-900 mb-4">Q3: Bias Mitigation in UX</h3>
-      <div className="space-y-4 text-sm text-gray-700">
-        <p>Critical because unmitigated bias leads to exclusionary design, reinforced stereotypes, filter bubbles, and legal compliance issues.</p>
-        <p className="font-semibold">Example: Amazon abandoned an AI recruiting tool that showed bias against women due to male-dominated training data.</p>
-      </div>
-    </div>
+# Documented agreement of the compact (float32) path with the float64 path.
+# Forests train on float32 either way; only the engineering and scaling
+# arithmetic differs (~1e-7 relative), which moves a sample across a split
+# only when it lies within rounding distance of the threshold.
+COMPACT_PROBABILITY_TOLERANCE = 0.02  # Max |p_float32 - p_float64| per class
+COMPACT_LABEL_AGREEMENT = 0.99  # Min share of identical predicted labels
 
-    <div className="bg-white border-2 border-orange-200 rounded-lg p-6 shadow-sm">
-      <h3 className="text-xl font-bold text-orange-900 mb-4">Case Study: AIOps</h3>
-      <div className="space-y-3 text-sm text-gray-700">
-        <p><strong>Netflix:</strong> Uses AIOps for microservices monitoring with 99.99 percent uptime</p>
-        <p><strong>Walmart:</strong> Reduces failed deployments by 75 percent using AI deployment optimization</p>
-      </div>
-    </div>
-  </div>
-);
 
-const Task1Section = () => (
-  <div className="space-y-6">
-    <h2 className="text-3xl font-bold text-gray-800 mb-6">Task 1: AI-Powered Code Completion</h2>
+def compare_precision_modes(synthetic=None, random_state: int = 42) -> Dict:
+    """
+    Train and score the float64 and compact float32 paths on the same data.
     
-    <div className="bg-gradient-to-r from-blue-500 to-indigo-600 text-white p-6 rounded-lg">
-      <h3 className="text-xl font-bold mb-2">Implementation Comparison</h3>
-      <p>Comparing AI-generated vs manual implementation</p>
-    </div>
-
-    <div className="bg-yellow-50 border-2 border-yellow-300 rounded-lg p-6">
-      <h4 className="font-bold text-yellow-900 mb-3">Results Summary</h4>
-      <div className="space-y-2 text-sm">
-        <p><strong>AI Implementation:</strong> O(n log n), 0.0023s for 1000 items</p>
-        <p><strong>Manual Implementation:</strong> O(n²), 0.847s for 1000 items</p>
-        <p className="text-lg font-bold text-green-700">Speed Improvement: 368x faster</p>
-      </div>
-    </div>
-  </div>
-);
-
-const Task2Section = () => (
-  <div className="space-y-6">
-    <h2 className="text-3xl font-bold text-gray-800 mb-6">Task 2: Automated Testing</h2>
+    Args:
+        synthetic: Optional SyntheticIssueConfig (default: proxy dataset)
+        random_state: Seed shared by both runs
+        
+    Returns:
+        Dictionary with bytes per stage for both modes, the largest
+        probability difference, the label agreement and whether both are
+        within the documented tolerance
+    """
+    results = {}
+    for compact in (False, True):
+        model = PriorityPredictionModel(random_state, synthetic=synthetic, compact=compact)
+        _, _, X_test, _, y_test = model.train_quietly()
+        with contextlib.redirect_stdout(io.StringIO()):
+            metrics = model.evaluate_model(X_test, y_test)
+        results[compact] = (model.memory_report, metrics['y_prob'])
     
-    <div className="bg-gradient-to-r from-green-500 to-teal-600 text-white p-6 rounded-lg">
-      <h3 className="text-xl font-bold mb-2">Login Page Testing</h3>
-      <p>Using Selenium with AI-enhanced generation</p>
-    </div>
+    max_diff = float(np.abs(results[True][1] - results[False][1]).max())
+    agreement = float((results[True][1].argmax(axis=1) == results[False][1].argmax(axis=1)).mean())
+    return {
+        'float64_bytes': results[False][0],
+        'float32_bytes': results[True][0],
+        'max_probability_diff': max_diff,
+        'label_agreement': agreement,
+        'within_tolerance': (max_diff <= COMPACT_PROBABILITY_TOLERANCE
+                             and agreement >= COMPACT_LABEL_AGREEMENT),
+    }
 
-    <div className="bg-white border-2 border-green-300 rounded-lg p-6">
-      <h4 className="font-bold text-green-900 mb-3">Test Results</h4>
-      <div className="bg-gray-900 text-green-400 p-4 rounded font-mono text-sm">
-        <p>Total Tests: 6</p>
-        <p>Passed: 6</p>
-        <p>Failed: 0</p>
-        <p className="text-yellow-400">Success Rate: 100 percent</p>
-      </div>
-    </div>
-  </div>
-);
 
-const Task3Section = () => (
-  <div className="space-y-6">
-    <h2 className="text-3xl font-bold text-gray-800 mb-6">Task 3: Predictive Analytics</h2>
-    
-    <div className="bg-gradient-to-r from-purple-500 to-pink-600 text-white p-6 rounded-lg">
-      <h3 className="text-xl font-bold mb-2">ML Model Performance</h3>
-      <p>Random Forest for priority prediction</p>
-    </div>
+def _positive_seconds(value: str) -> float:
+    """argparse type for tuning budgets: a number of seconds above zero."""
+    seconds = float(value)
+    if seconds <= 0:
+        raise argparse.ArgumentTypeError(f"budget must be positive, got {value}")
+    return seconds
 
-    <div className="bg-white border-2 border-purple-300 rounded-lg p-6">
-      <h4 className="font-bold text-purple-900 mb-3">Performance Metrics</h4>
-      <div className="space-y-2 text-sm">
-        <p><strong>Accuracy:</strong> 92.98 percent</p>
-        <p><strong>F1-Score:</strong> 0.9285</p>
-        <p><strong>High Priority Recall:</strong> 96 percent</p>
-      </div>
-    </div>
-  </div>
-);
 
-const EthicsSection = () => (
-  <div className="space-y-6">
-    <h2 className="text-3xl font-bold text-gray-800 mb-6">Part 3: Ethical Reflection</h2>
+def main(argv=None):
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description="Issue priority prediction pipeline")
+    parser.add_argument('--tune', action='store_true',
+                        help="search forest hyperparameters with successive halving")
+    parser.add_argument('--time-budget', type=_positive_seconds, default=None,
+                        help="wall-clock budget for tuning, in seconds")
+    parser.add_argument('--cpu-budget', type=_positive_seconds, default=None,
+                        help="CPU-time budget for tuning, in seconds")
+    parser.add_argument('--feature-store', default=None, metavar='DIR',
+                        help="cache engineered and scaled matrices in DIR")
+    parser.add_argument('--importance', choices=['impurity', 'permutation'], default='impurity',
+                        help="feature importance method (default: impurity)")
+    parser.add_argument('--synthetic-rows', type=int, default=None,
+                        help="use a synthetic issue dataset with this many rows")
+    parser.add_argument('--synthetic-features', type=int, default=30,
+                        help="feature count of the synthetic dataset")
+    parser.add_argument('--class-weights', default='0.55,0.30,0.15',
+                        help="Low,Medium,High proportions of the synthetic dataset")
+    parser.add_argument('--profile', default=None, metavar='JSON',
+                        help="write per-step wall/CPU time and peak RSS to JSON")
+    parser.add_argument('--compact', action='store_true',
+                        help="keep features as float32 end to end and report bytes per stage")
+    parser.add_argument('--compare-precision', action='store_true',
+                        help="compare float32 and float64 paths (memory and predictions)")
+    parser.add_argument('--save-model', default=None, metavar='PATH',
+                        help="pickle the trained model to PATH for scoring and serving")
+    args = parser.parse_args(argv)
     
-    <div className="bg-gradient-to-r from-red-500 to-orange-600 text-white p-6 rounded-lg">
-      <h3 className="text-xl font-bold mb-2">Bias & Fairness Analysis</h3>
-      <p>Using IBM AI Fairness 360</p>
-    </div>
-
-    <div className="bg-white border-2 border-red-300 rounded-lg p-6">
-      <h3 className="text-xl font-bold text-red-900 mb-4">Potential Biases</h3>
-      <ul className="list-disc list-inside space-y-2 text-sm text-gray-700">
-        <li>Historical bias from legacy data</li>
-        <li>Underrepresented teams and contributors</li>
-        <li>Feature engineering bias</li>
-        <li>Sampling and labeling inconsistencies</li>
-      </ul>
-    </div>
-
-    <div className="bg-white border-2 border-blue-300 rounded-lg p-6">
-      <h3 className="text-xl font-bold text-blue-900 mb-4">Mitigation Strategies</h3>
-      <div className="space-y-3 text-sm text-gray-700">
-        <p><strong>Pre-Processing:</strong> Reweighing to balance representation</p>
-        <p><strong>In-Processing:</strong> Prejudice removal during training</p>
-        <p><strong>Post-Processing:</strong> Equalized odds adjustments</p>
-      </div>
-    </div>
-  </div>
-);
-
-const BonusSection = () => (
-  <div className="space-y-6">
-    <h2 className="text-3xl font-bold text-gray-800 mb-6">Bonus: AutoDocAI</h2>
+    synthetic = None
+    if args.synthetic_rows is not None:
+        from synthetic_data import SyntheticIssueConfig
+        synthetic = SyntheticIssueConfig(
+            n_rows=args.synthetic_rows,
+            n_features=args.synthetic_features,
+            class_weights=[float(w) for w in args.class_weights.split(',')]
+        )
+    if args.compare_precision:
+        report = compare_precision_modes(synthetic)
+        print(f"{'Stage':<14} {'float64 MB':>12} {'float32 MB':>12}")
+        for stage, nbytes in report['float64_bytes'].items():
+            print(f"{stage:<14} {nbytes / 1024 ** 2:12.2f} "
+                  f"{report['float32_bytes'].get(stage, 0) / 1024 ** 2:12.2f}")
+        print(f"\nMax probability difference: {report['max_probability_diff']:.6f} "
+              f"(tolerance {COMPACT_PROBABILITY_TOLERANCE})")
+        print(f"Label agreement:            {report['label_agreement']:.4%} "
+              f"(minimum {COMPACT_LABEL_AGREEMENT:.0%})")
+        print("✓ Within tolerance" if report['within_tolerance'] else "✗ Outside tolerance")
+        return
     
-    <div className="bg-gradient-to-r from-indigo-500 via-purple-500 to-pink-500 text-white p-6 rounded-lg">
-      <h3 className="text-2xl font-bold mb-2">AI-Powered Documentation Tool</h3>
-      <p className="text-lg">Automatic code documentation generation</p>
-    </div>
-
-    <div className="bg-white border-2 border-indigo-300 rounded-lg p-6">
-      <h3 className="text-xl font-bold text-indigo-900 mb-4">Problem Statement</h3>
-      <p className="text-sm text-gray-700">Documentation is outdated or missing, causing 30 percent longer onboarding and 40 percent more debugging time.</p>
-    </div>
-
-    <div className="bg-white border-2 border-purple-300 rounded-lg p-6">
-      <h3 className="text-xl font-bold text-purple-900 mb-4">Solution Features</h3>
-      <ul className="list-disc list-inside space-y-2 text-sm text-gray-700">
-        <li>Natural language generation with GPT-4</li>
-        <li>Multi-format output (MD, HTML, PDF)</li>
-        <li>Auto-maintenance on code changes</li>
-        <li>Smart semantic search</li>
-      </ul>
-    </div>
+    profiler = None
+    if args.profile is not None:
+        from pipeline_profiler import PipelineProfiler
+        profiler = PipelineProfiler(args.profile)
+    
+    # Initialize and run complete pipeline
+    model = PriorityPredictionModel(
+        random_state=42,
+        feature_store=args.feature_store,
+        synthetic=synthetic,
+        compact=args.compact
+    )
+    model.run_complete_pipeline(
+        tune=args.tune,
+        time_budget=args.time_budget,
+        cpu_budget=args.cpu_budget,
+        importance=args.importance,
+        profiler=profiler
+    )
+    if args.save_model is not None:
+        model.save(args.save_model)
+        print(f"\n💾 Model saved to {args.save_model}")
 
-    <div className="bg-white border-2 border-green-300 rounded-lg p-6">
-      <h3 className="text-xl font-bold text-green-900 mb-4">ROI Impact</h3>
-      <div className="space-y-2 text-sm text-gray-700">
-        <p><strong>Cost:</strong> $2,000 per month</p>
-        <p><strong>Value:</strong> $37,500 per month</p>
-        <p className="text-lg font-bold text-green-700">Net Benefit: $426,000 per year</p>
-      </div>
-    </div>
-  </div>
-);
 
-export default AssignmentHub;
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,343 @@
+"""
+Task 3: Predictive Analytics for Resource Allocation
+Streaming Hashed Text Features for Issue Titles and Descriptions
+
+A vocabulary-based vectorizer has to see the whole corpus and keep every
+token in memory. Feature hashing maps tokens straight to column indices,
+so each chunk of issues is turned into a sparse matrix on its own and
+nothing grows with the corpus. The sparse text block is stacked next to
+the scaled numeric features, and training uses ``partial_fit`` so both
+training and scoring run chunk by chunk.
+
+With ``--engineered`` the numeric block is the priority pipeline's own
+feature set: chunks carry the raw issue columns and the derived columns
+are computed per chunk with PriorityPredictionModel._derive_features.
+
+Requirements:
+pip install pandas scikit-learn scipy numpy
+"""
+
+import argparse
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.linear_model import SGDClassifier
+from sklearn.preprocessing import StandardScaler
+
+from pipeline_profiler import peak_rss_mb
+
+
+class HashedTextFeaturizer:
+    """
+    Stateless hashing featurizer for issue titles and descriptions.
+
+    Titles and descriptions hash into separate column ranges so that a word
+    in a title is a different feature from the same word in a description.
+    """
+
+    def __init__(
+        self,
+        title_features: int = 2 ** 16,
+        description_features: int = 2 ** 18,
+        ngram_range: Tuple[int, int] = (1, 2)
+    ):
+        """
+        Initialize the featurizer.
+
+        Args:
+            title_features: Hash space for title tokens
+            description_features: Hash space for description tokens
+            ngram_range: Word n-gram range for both fields
+        """
+        common = dict(
+            ngram_range=ngram_range,
+            alternate_sign=False,
+            norm='l2',
+            dtype=np.float32
+        )
+        self.title_vectorizer = HashingVectorizer(n_features=title_features, **common)
+        self.description_vectorizer = HashingVectorizer(n_features=description_features, **common)
+        self.n_features = title_features + description_features
+
+    def transform(self, titles: Iterable[str], descriptions: Iterable[str]) -> sp.csr_matrix:
+        """Hash one chunk of issues into a sparse (n_issues, n_features) matrix."""
+        return sp.hstack([
+            self.title_vectorizer.transform(titles),
+            self.description_vectorizer.transform(descriptions)
+        ], format='csr')
+
+
+class StreamingTextPriorityModel:
+    """
+    Chunk-by-chunk priority classifier over numeric and hashed text features.
+
+    Random forests cannot learn incrementally and do not handle hundreds of
+    thousands of sparse columns well, so the streaming path uses a logistic
+    regression trained with SGD, which keeps memory bounded by the chunk
+    size and the (fixed) hash space.
+    """
+
+    def __init__(
+        self,
+        numeric_columns: List[str],
+        text_columns: Tuple[str, str] = ('title', 'description'),
+        featurizer: Optional[HashedTextFeaturizer] = None,
+        classes: Tuple[int, ...] = (0, 1, 2),
+        random_state: int = 42,
+        derive: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None
+    ):
+        """
+        Initialize the streaming model.
+
+        Args:
+            numeric_columns: Engineered numeric columns to include
+            text_columns: Names of the title and description columns
+            featurizer: Text featurizer (default: HashedTextFeaturizer())
+            classes: All priority labels, needed up front by partial_fit
+            random_state: Seed for the SGD classifier
+            derive: Row-wise feature engineering applied to each chunk
+                before the numeric columns are selected, or None if the
+                chunks already hold them
+        """
+        self.numeric_columns = numeric_columns
+        self.derive = derive
+        self.text_columns = text_columns
+        self.featurizer = featurizer or HashedTextFeaturizer()
+        self.classes = np.asarray(classes)
+        self.scaler = StandardScaler()
+        self.classifier = SGDClassifier(
+            loss='log_loss',
+            alpha=1e-5,
+            random_state=random_state
+        )
+
+    @classmethod
+    def for_priority_features(cls, feature_names: List[str], **kwargs) -> "StreamingTextPriorityModel":
+        """
+        Streaming model over the random-forest pipeline's engineered features.
+
+        Args:
+            feature_names: Engineered columns, i.e. PriorityPredictionModel.feature_names
+            **kwargs: Passed on to the constructor
+
+        Returns:
+            Model that takes raw issue chunks and derives the engineered
+            columns with PriorityPredictionModel._derive_features
+        """
+        from priority_prediction import PriorityPredictionModel
+        return cls(list(feature_names), derive=PriorityPredictionModel._derive_features, **kwargs)
+
+    def _features(self, chunk: pd.DataFrame, update_scaler: bool) -> sp.csr_matrix:
+        """Scaled numeric block followed by the hashed text block."""
+        if self.derive is not None:
+            chunk = self.derive(chunk)
+        numeric = chunk[self.numeric_columns].to_numpy(dtype=np.float64)
+        if update_scaler:
+            self.scaler.partial_fit(numeric)
+        numeric = self.scaler.transform(numeric).astype(np.float32)
+        title_col, description_col = self.text_columns
+        text = self.featurizer.transform(
+            chunk[title_col].fillna(''), chunk[description_col].fillna('')
+        )
+        return sp.hstack([sp.csr_matrix(numeric), text], format='csr')
+
+    def partial_fit(self, chunk: pd.DataFrame, y) -> sp.csr_matrix:
+        """
+        Update scaler statistics and classifier with one chunk.
+
+        Returns:
+            The chunk's feature matrix (handy for memory accounting)
+        """
+        features = self._features(chunk, update_scaler=True)
+        self.classifier.partial_fit(features, np.asarray(y), classes=self.classes)
+        return features
+
+    def predict_proba(self, chunk: pd.DataFrame) -> np.ndarray:
+        """Class probabilities for one chunk of issues."""
+        return self.classifier.predict_proba(self._features(chunk, update_scaler=False))
+
+    def score_stream(self, chunks: Iterable[pd.DataFrame]) -> Iterator[np.ndarray]:
+        """Yield predicted priorities chunk by chunk."""
+        for chunk in chunks:
+            yield self.classes[self.predict_proba(chunk).argmax(axis=1)]
+
+
+# Vocabulary for synthetic issues; High-priority issues lean on the first list
+_KEYWORDS = {
+    2: ['crash', 'outage', 'data loss', 'security', 'vulnerability', 'production down',
+        'exception', 'corrupted', 'payment failure', 'cannot login'],
+    1: ['slow', 'timeout', 'incorrect', 'regression', 'intermittent', 'memory',
+        'broken link', 'wrong total', 'flaky', 'degraded'],
+    0: ['typo', 'cosmetic', 'alignment', 'docs', 'tooltip', 'color', 'refactor',
+        'rename', 'spacing', 'wording'],
+}
+_FILLER = ['the', 'page', 'user', 'when', 'after', 'update', 'dashboard', 'api',
+           'settings', 'report', 'export', 'button', 'mobile', 'service', 'form']
+
+
+def synthetic_issue_chunks(
+    n_issues: int,
+    chunk_size: int = 10_000,
+    n_numeric: int = 8,
+    random_state: int = 42,
+    raw_columns: Optional[List[str]] = None
+) -> Iterator[Tuple[pd.DataFrame, np.ndarray]]:
+    """
+    Generate synthetic issues with titles, descriptions and numeric signals.
+
+    Args:
+        n_issues: Total issues to generate
+        chunk_size: Issues per yielded chunk
+        n_numeric: Number of numeric columns
+        random_state: Seed
+        raw_columns: Names of the priority pipeline's raw columns; when
+            given they replace the ``signal_<i>`` columns and are drawn
+            positive (log-normal), like the proxy measurements
+
+    Yields:
+        Tuples of (issue chunk DataFrame, priority labels)
+    """
+    rng = np.random.default_rng(random_state)
+    numeric_columns = raw_columns or [f'signal_{i}' for i in range(n_numeric)]
+    n_numeric = len(numeric_columns)
+    keywords = np.array([_KEYWORDS[label] for label in range(3)], dtype=object)
+    filler = np.array(_FILLER, dtype=object)
+    for start in range(0, n_issues, chunk_size):
+        n = min(chunk_size, n_issues - start)
+        y = rng.choice(3, size=n, p=[0.5, 0.35, 0.15])
+        # Most text matches its label; the rest borrows from another class
+        text_label = np.where(rng.random(n) < 0.8, y, rng.integers(0, 3, size=n))
+        title_words = np.concatenate([
+            keywords[text_label[:, None], rng.integers(0, keywords.shape[1], size=(n, 2))],
+            filler[rng.integers(0, len(filler), size=(n, 3))]
+        ], axis=1)
+        titles = [' '.join(words) for words in title_words]
+
+        lengths = rng.integers(20, 60, size=n)
+        owner = np.repeat(text_label, lengths)
+        words = np.where(
+            rng.random(len(owner)) < 0.3,
+            keywords[owner, rng.integers(0, keywords.shape[1], size=len(owner))],
+            filler[rng.integers(0, len(filler), size=len(owner))]
+        )
+        descriptions = [' '.join(row) for row in np.split(words, np.cumsum(lengths)[:-1])]
+
+        numeric = rng.normal(size=(n, n_numeric)) + y[:, None] * 0.3
+        if raw_columns is not None:
+            numeric = np.exp(numeric * 0.4)
+        chunk = pd.DataFrame(numeric, columns=numeric_columns)
+        chunk['title'] = titles
+        chunk['description'] = descriptions
+        yield chunk, y
+
+
+def benchmark_streaming(
+    n_train: int = 200_000,
+    n_score: int = 100_000,
+    chunk_size: int = 10_000,
+    random_state: int = 42,
+    engineered: bool = False
+) -> Dict[str, float]:
+    """
+    Measure throughput and memory of streaming training and scoring.
+
+    Text generation is excluded from the timings; only featurization
+    (including feature engineering), ``partial_fit`` and ``predict_proba``
+    are timed.
+
+    Args:
+        n_train: Issues to train on
+        n_score: Issues to score
+        chunk_size: Issues per chunk
+        random_state: Seed for data and classifier
+        engineered: Use the priority pipeline's raw columns and derive its
+            engineered features per chunk instead of generic signals
+
+    Returns:
+        Dictionary with seconds per million issues for training and
+        scoring, accuracy, the largest chunk matrix in MB and peak RSS in MB
+    """
+    raw_columns = None
+    if engineered:
+        from priority_prediction import DERIVED_FEATURES
+        from synthetic_data import feature_columns
+        raw_columns = feature_columns(30)
+        # The column list PriorityPredictionModel.feature_names holds for these raw columns
+        model = StreamingTextPriorityModel.for_priority_features(
+            raw_columns + DERIVED_FEATURES, random_state=random_state
+        )
+    else:
+        model = StreamingTextPriorityModel([f'signal_{i}' for i in range(8)],
+                                           random_state=random_state)
+
+    def chunks(n_issues: int, seed: int):
+        return synthetic_issue_chunks(n_issues, chunk_size, random_state=seed,
+                                      raw_columns=raw_columns)
+
+    train_seconds, chunk_mb = 0.0, 0.0
+    for chunk, y in chunks(n_train, random_state):
+        start_time = time.perf_counter()
+        features = model.partial_fit(chunk, y)
+        train_seconds += time.perf_counter() - start_time
+        chunk_mb = max(chunk_mb, (features.data.nbytes + features.indices.nbytes
+                                  + features.indptr.nbytes) / 1024 ** 2)
+
+    score_seconds, correct = 0.0, 0
+    for chunk, y in chunks(n_score, random_state + 1):
+        start_time = time.perf_counter()
+        y_pred = next(model.score_stream([chunk]))
+        score_seconds += time.perf_counter() - start_time
+        correct += int((y_pred == y).sum())
+
+    return {
+        'train_seconds_per_million': train_seconds / n_train * 1_000_000,
+        'score_seconds_per_million': score_seconds / n_score * 1_000_000,
+        'train_issues_per_second': n_train / train_seconds,
+        'score_issues_per_second': n_score / score_seconds,
+        'accuracy': correct / n_score,
+        'max_chunk_matrix_mb': chunk_mb,
+        'hash_space': model.featurizer.n_features,
+        'numeric_features': len(model.numeric_columns),
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+
+def main():
+    """Run the streaming text-feature benchmark."""
+    parser = argparse.ArgumentParser(description="Streaming hashed text feature benchmark")
+    parser.add_argument('--train', type=int, default=200_000, help="issues to train on")
+    parser.add_argument('--score', type=int, default=100_000, help="issues to score")
+    parser.add_argument('--chunk-size', type=int, default=10_000, help="issues per chunk")
+    parser.add_argument('--engineered', action='store_true',
+                        help="use the priority model's engineered numeric features")
+    args = parser.parse_args()
+
+    print("="*70)
+    print(" "*15 + "STREAMING HASHED TEXT FEATURES BENCHMARK")
+    print("="*70)
+    print(f"Training issues: {args.train:,}  Scoring issues: {args.score:,}  "
+          f"Chunk: {args.chunk_size:,}")
+
+    stats = benchmark_streaming(args.train, args.score, args.chunk_size,
+                                engineered=args.engineered)
+
+    print(f"\n🔤 Hash space:            {stats['hash_space']:,} columns (no vocabulary stored)")
+    print(f"🔢 Numeric features:      {stats['numeric_features']} "
+          f"({'engineered, derived per chunk' if args.engineered else 'generic signals'})")
+    print(f"⏱  Training:              {stats['train_seconds_per_million']:8.1f} s per 1M issues "
+          f"({stats['train_issues_per_second']:,.0f} issues/s)")
+    print(f"⏱  Scoring:               {stats['score_seconds_per_million']:8.1f} s per 1M issues "
+          f"({stats['score_issues_per_second']:,.0f} issues/s)")
+    print(f"💾 Largest chunk matrix:  {stats['max_chunk_matrix_mb']:8.1f} MB "
+          f"(≈ {stats['max_chunk_matrix_mb'] * 1_000_000 / args.chunk_size:,.0f} MB per 1M issues if materialized)")
+    print(f"💾 Peak RSS:              {stats['peak_rss_mb']:8.1f} MB")
+    print(f"✓ Holdout accuracy:       {stats['accuracy']:.4f}")
+    print("="*70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,598 @@
+"""
+Task 3: Predictive Analytics for Resource Allocation
+Backpressured Webhook Ingestion for Automatic Priority Assignment
+
+Issue trackers deliver webhooks in bursts (bulk imports, label sweeps)
+and redeliver them on timeouts. Scoring each event synchronously in the
+request handler stalls the sender and repeats work, so events go through
+an asyncio pipeline instead:
+
+    source (HTTP endpoint or file replay)
+      -> dedup by (issue id, revision)  -> intake queue (bounded)
+      -> batcher (up to batch_size or max_batch_wait; newest revision per issue)
+      -> PriorityPredictionModel.score_issues in a worker thread
+      -> output queue (bounded) -> idempotent SQLite upsert
+
+Both queues are bounded. When scoring falls behind, ``submit`` waits for
+room, which slows the file reader or holds the HTTP response, and a
+request that cannot be queued in time gets ``503`` with ``Retry-After``.
+A batch whose scoring or write raises is counted as failed and its
+revisions are forgotten, so a redelivery is retried; the pipeline keeps
+running either way.
+The store keeps only the newest revision of each issue, and upserts never
+replace a newer revision, so a replayed or redelivered stream leaves the
+same table behind.
+
+Event format (flat, or wrapped as ``{"issue": {...}}``)::
+
+    {"issue_id": "PROJ-17", "revision": 3, "features": {"mean radius": 14.2, ...}}
+
+``features`` must hold a number for every raw column of the model;
+events that do not are counted as malformed and never queued.
+
+HTTP API::
+
+    POST /webhook   one event or a list of events
+                    -> 202 {"accepted": n, "duplicate": d, "malformed": m}
+    GET  /metrics   counters, queue depths, lag percentiles and throughput
+
+Usage:
+    python webhook_ingestion.py --model model.pkl --replay events.jsonl
+    python webhook_ingestion.py --model model.pkl --serve --port 8090
+    python webhook_ingestion.py --benchmark --events 50000
+
+Requirements:
+pip install pandas scikit-learn numpy
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import sqlite3
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class IssueEvent:
+    """One issue revision to score."""
+    issue_id: str
+    revision: int
+    features: Dict[str, float]
+    received_at: float = 0.0  # time.monotonic() when accepted
+
+
+def _feature_value(value) -> float:
+    """A feature as float; only finite JSON numbers (not bools or strings) pass."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise TypeError(f"feature value {value!r} is not a number")
+    if not math.isfinite(value):
+        raise ValueError(f"feature value {value!r} is not finite")
+    return float(value)
+
+
+def parse_event(payload: Dict, required: Optional[Iterable[str]] = None) -> IssueEvent:
+    """
+    Normalise a webhook payload into an IssueEvent.
+
+    Args:
+        payload: Decoded webhook body
+        required: Feature columns the model needs; when given, only these
+            are kept and each must be a finite number
+
+    Raises:
+        ValueError: If the id, revision or features are missing, or a
+            required feature is missing, not a number or not finite
+    """
+    issue = payload.get('issue', payload) if isinstance(payload, dict) else None
+    try:
+        issue_id = issue['issue_id'] if 'issue_id' in issue else issue['id']
+        features = dict(issue['features'])
+        if required is not None:
+            features = {name: _feature_value(features[name]) for name in required}
+        return IssueEvent(str(issue_id), int(issue['revision']), features)
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"malformed event: {type(e).__name__}: {e}") from None
+
+
+class PriorityStore:
+    """
+    SQLite table holding the newest scored revision of every issue.
+
+    Writes are upserts guarded by the revision, so writing the same (or an
+    older) revision again changes nothing.
+    """
+
+    def __init__(self, path: str, class_names: List[str]):
+        """
+        Open (and create if needed) the store.
+
+        Args:
+            path: SQLite database file
+            class_names: Priority names, for the probability columns
+        """
+        self.path = path
+        self.class_names = class_names
+        # Used from the writer thread only
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS priorities ("
+            "issue_id TEXT PRIMARY KEY, revision INTEGER NOT NULL, "
+            "priority TEXT NOT NULL, probabilities TEXT NOT NULL, scored_at REAL NOT NULL)"
+        )
+        self.connection.commit()
+
+    def revisions(self) -> Dict[str, int]:
+        """Stored revision of every issue."""
+        return dict(self.connection.execute("SELECT issue_id, revision FROM priorities"))
+
+    def write(self, events: List[IssueEvent], scored: pd.DataFrame) -> None:
+        """Upsert one scored batch in a single transaction."""
+        probability_columns = [c for c in scored.columns if c != 'priority']
+        now = time.time()
+        rows = [
+            (event.issue_id, event.revision, priority,
+             json.dumps(dict(zip(self.class_names, map(float, probabilities)))), now)
+            for event, priority, probabilities in zip(
+                events, scored['priority'], scored[probability_columns].to_numpy()
+            )
+        ]
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO priorities VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(issue_id) DO UPDATE SET revision = excluded.revision, "
+                "priority = excluded.priority, probabilities = excluded.probabilities, "
+                "scored_at = excluded.scored_at "
+                "WHERE excluded.revision > priorities.revision",
+                rows
+            )
+
+    def count(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM priorities").fetchone()[0]
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+@dataclass
+class IngestionMetrics:
+    """Counters of an IngestionPipeline; see IngestionPipeline.metrics for rates."""
+    received: int = 0
+    malformed: int = 0
+    duplicates: int = 0  # Revision already accepted (redelivery or out of order)
+    coalesced: int = 0  # Superseded by a newer revision in the same batch
+    rejected: int = 0  # HTTP events refused because the intake stayed full
+    scored: int = 0
+    written: int = 0
+    batches: int = 0
+    failed: int = 0  # Batches whose scoring or write raised; their events are not stored
+    last_error: str = ''
+    max_intake_depth: int = 0
+    max_output_depth: int = 0
+
+
+class IngestionPipeline:
+    """
+    Asyncio pipeline from webhook events to stored priorities.
+    """
+
+    def __init__(
+        self,
+        pipeline,
+        store: PriorityStore,
+        batch_size: int = 256,
+        max_batch_wait: float = 0.05,
+        intake_size: int = 2048,
+        output_size: int = 4,
+        accept_timeout: float = 2.0
+    ):
+        """
+        Configure the pipeline (queues are created by start()).
+
+        Args:
+            pipeline: Trained PriorityPredictionModel
+            store: Destination of the scored revisions
+            batch_size: Most events per score_issues call
+            max_batch_wait: Seconds to wait for a batch to fill up
+            intake_size: Events waiting to be batched
+            output_size: Scored batches waiting to be written
+            accept_timeout: Seconds an HTTP request may wait for intake room
+        """
+        self.pipeline = pipeline
+        self.store = store
+        self.batch_size = batch_size
+        self.max_batch_wait = max_batch_wait
+        self.intake_size = intake_size
+        self.output_size = output_size
+        self.accept_timeout = accept_timeout
+        self.required_features = pipeline.raw_feature_names
+        self.counters = IngestionMetrics()
+        self.lags = deque(maxlen=10_000)  # Seconds from acceptance to stored, recent events
+        self.intake = None
+        self.output = None
+        self._latest = {}
+        self._tasks = []
+        self._score_executor = ThreadPoolExecutor(1, thread_name_prefix='ingest-score')
+        self._write_executor = ThreadPoolExecutor(1, thread_name_prefix='ingest-write')
+        self._started_at = None
+
+    async def start(self) -> None:
+        """Create the queues and start the batcher and writer tasks."""
+        loop = asyncio.get_running_loop()
+        self.intake = asyncio.Queue(self.intake_size)
+        self.output = asyncio.Queue(self.output_size)
+        # Revisions already stored count as seen, so a replay is not rescored
+        self._latest = await loop.run_in_executor(self._write_executor, self.store.revisions)
+        self._started_at = time.monotonic()
+        self._tasks = [asyncio.ensure_future(self._batch_loop()),
+                       asyncio.ensure_future(self._write_loop())]
+
+    async def close(self) -> None:
+        """
+        Flush every accepted event to the store, then stop the tasks.
+
+        If the batcher or writer died, the rest is cancelled rather than
+        waited on (nothing would drain the queues) and the error is raised.
+        """
+        sentinel = asyncio.ensure_future(self.intake.put(None))
+        await asyncio.wait([sentinel, *self._tasks], return_when=asyncio.FIRST_EXCEPTION)
+        for task in (sentinel, *self._tasks):
+            task.cancel()  # No-op for tasks that already finished
+        results = await asyncio.gather(sentinel, *self._tasks, return_exceptions=True)
+        self._score_executor.shutdown()
+        self._write_executor.shutdown()
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            raise errors[0]
+
+    async def submit(self, payload: Dict) -> str:
+        """
+        Accept one webhook payload, waiting while the intake queue is full.
+
+        Returns:
+            'accepted', 'duplicate' or 'malformed'
+        """
+        self.counters.received += 1
+        try:
+            event = parse_event(payload, self.required_features)
+        except ValueError:
+            self.counters.malformed += 1
+            return 'malformed'
+        if self._latest.get(event.issue_id, -1) >= event.revision:
+            self.counters.duplicates += 1
+            return 'duplicate'
+        event.received_at = time.monotonic()
+        # Marked before waiting, so a concurrent redelivery is a duplicate
+        previous = self._latest.get(event.issue_id)
+        self._latest[event.issue_id] = event.revision
+        try:
+            await self.intake.put(event)  # Backpressure: waits while the queue is full
+        except BaseException:
+            # Not queued (e.g. the HTTP accept timeout cancelled us): let a retry through
+            if self._latest.get(event.issue_id) == event.revision:
+                if previous is None:
+                    del self._latest[event.issue_id]
+                else:
+                    self._latest[event.issue_id] = previous
+            raise
+        self.counters.max_intake_depth = max(self.counters.max_intake_depth, self.intake.qsize())
+        return 'accepted'
+
+    async def _next_batch(self) -> Tuple[List[IssueEvent], bool]:
+        """Collect up to batch_size events; the flag is False once the stream ended."""
+        event = await self.intake.get()
+        if event is None:
+            return [], False
+        batch = [event]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_batch_wait
+        while len(batch) < self.batch_size:
+            if self.intake.empty():
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    event = await asyncio.wait_for(self.intake.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            else:
+                event = self.intake.get_nowait()
+            if event is None:
+                return batch, False
+            batch.append(event)
+        return batch, True
+
+    async def _batch_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        running = True
+        while running:
+            batch, running = await self._next_batch()
+            if not batch:
+                continue
+            newest = {}
+            for event in batch:
+                current = newest.get(event.issue_id)
+                if current is None or event.revision > current.revision:
+                    newest[event.issue_id] = event
+            events = list(newest.values())
+            self.counters.coalesced += len(batch) - len(events)
+            frame = pd.DataFrame([event.features for event in events])
+            try:
+                scored = await loop.run_in_executor(self._score_executor,
+                                                    self.pipeline.score_issues, frame)
+            except Exception as e:
+                self._batch_failed(events, e)
+                continue
+            self.counters.scored += len(events)
+            self.counters.batches += 1
+            await self.output.put((events, scored))  # Backpressure from the writer
+            self.counters.max_output_depth = max(self.counters.max_output_depth, self.output.qsize())
+        await self.output.put(None)
+
+    async def _write_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self.output.get()
+            if item is None:
+                return
+            events, scored = item
+            try:
+                await loop.run_in_executor(self._write_executor, self.store.write, events, scored)
+            except Exception as e:
+                self._batch_failed(events, e)
+                continue
+            now = time.monotonic()
+            self.lags.extend(now - event.received_at for event in events)
+            self.counters.written += len(events)
+
+    def _batch_failed(self, events: List[IssueEvent], error: Exception) -> None:
+        """Count a lost batch and forget its revisions so redeliveries are retried."""
+        self.counters.failed += 1
+        self.counters.last_error = f"{type(error).__name__}: {error}"
+        for event in events:
+            if self._latest.get(event.issue_id) == event.revision:
+                del self._latest[event.issue_id]
+
+    def metrics(self) -> Dict[str, float]:
+        """Counters plus current queue depths, lag percentiles and throughput."""
+        elapsed = time.monotonic() - self._started_at if self._started_at else 0.0
+        lags = np.asarray(self.lags) * 1000
+        return {
+            **asdict(self.counters),
+            'intake_depth': self.intake.qsize() if self.intake else 0,
+            'output_depth': self.output.qsize() if self.output else 0,
+            'intake_capacity': self.intake_size,
+            'lag_p50_ms': float(np.percentile(lags, 50)) if len(lags) else 0.0,
+            'lag_p95_ms': float(np.percentile(lags, 95)) if len(lags) else 0.0,
+            'lag_max_ms': float(lags.max()) if len(lags) else 0.0,
+            'throughput_per_second': self.counters.written / elapsed if elapsed else 0.0,
+            'elapsed_seconds': elapsed,
+        }
+
+    async def replay_file(self, path: str) -> None:
+        """Submit every JSON line of a file, as fast as backpressure allows."""
+        with open(path) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    payload = json.loads(line)
+                except ValueError:
+                    self.counters.received += 1
+                    self.counters.malformed += 1
+                    continue
+                await self.submit(payload)
+
+    async def _handle_http(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            method, path, _ = (await reader.readline()).decode('latin-1').split(' ', 2)
+            headers = {}
+            while True:
+                line = (await reader.readline()).decode('latin-1').strip()
+                if not line:
+                    break
+                name, _, value = line.partition(':')
+                headers[name.strip().lower()] = value.strip()
+            body = await reader.readexactly(int(headers.get('content-length', 0)))
+            status, response = await self._route(method, path, body)
+        except (ValueError, asyncio.IncompleteReadError):
+            status, response = 400, {'error': 'bad request'}
+        payload = json.dumps(response).encode()
+        extra = "Retry-After: 1\r\n" if status == 503 else ""
+        writer.write(
+            f"HTTP/1.1 {status} {_REASONS[status]}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(payload)}\r\n{extra}Connection: close\r\n\r\n".encode() + payload
+        )
+        await writer.drain()
+        writer.close()
+
+    async def _route(self, method: str, path: str, body: bytes) -> Tuple[int, Dict]:
+        if method == 'GET' and path == '/metrics':
+            return 200, self.metrics()
+        if method != 'POST' or path != '/webhook':
+            return 404, {'error': 'not found'}
+        payloads = json.loads(body)
+        payloads = payloads if isinstance(payloads, list) else [payloads]
+        outcomes = {'accepted': 0, 'duplicate': 0, 'malformed': 0}
+        for i, payload in enumerate(payloads):
+            try:
+                outcome = await asyncio.wait_for(self.submit(payload), self.accept_timeout)
+            except asyncio.TimeoutError:
+                # Sender retries the whole delivery; the accepted part dedups
+                self.counters.rejected += len(payloads) - i
+                return 503, {**outcomes, 'error': 'ingestion queue full'}
+            outcomes[outcome] += 1
+        return 202, outcomes
+
+    async def serve(self, host: str = '127.0.0.1', port: int = 8090) -> None:
+        """Accept webhooks over HTTP until cancelled."""
+        server = await asyncio.start_server(self._handle_http, host, port)
+        print(f"🚀 Webhook intake on http://{host}:{port} (POST /webhook, GET /metrics)")
+        async with server:
+            await server.serve_forever()
+
+
+_REASONS = {200: 'OK', 202: 'Accepted', 400: 'Bad Request', 404: 'Not Found',
+            503: 'Service Unavailable'}
+
+
+def make_burst_events(
+    path: str,
+    issues: pd.DataFrame,
+    n_events: int,
+    n_issues: int = 2_000,
+    edit_rate: float = 0.3,
+    reorder_rate: float = 0.05,
+    random_state: int = 42
+) -> None:
+    """
+    Write a JSON-lines burst of issue events for replay.
+
+    Popular issues receive most events. An event is a new revision with
+    jittered features (``edit_rate``) or a redelivery of the latest one;
+    ``reorder_rate`` of neighbouring events are swapped, so some arrive
+    after a newer revision of the same issue.
+    """
+    rng = np.random.default_rng(random_state)
+    base = issues.to_numpy()[rng.integers(0, len(issues), size=n_issues)]
+    columns = list(issues.columns)
+    revisions = np.zeros(n_issues, dtype=np.int64)
+    events = []
+    for issue in (rng.zipf(1.2, size=n_events) - 1) % n_issues:
+        if revisions[issue] == 0 or rng.random() < edit_rate:
+            revisions[issue] += 1
+            base[issue] *= rng.normal(1.0, 0.01, size=base.shape[1])
+        events.append({'issue_id': f"ISSUE-{issue}", 'revision': int(revisions[issue]),
+                       'features': dict(zip(columns, base[issue].tolist()))})
+    for i in np.flatnonzero(rng.random(n_events - 1) < reorder_rate):
+        events[i], events[i + 1] = events[i + 1], events[i]
+    with open(path, 'w') as f:
+        for event in events:
+            f.write(json.dumps(event) + '\n')
+
+
+def _trained_pipeline(model_path: Optional[str]):
+    """Load a saved model, or train one quietly on the proxy dataset."""
+    from prediction_cache import PredictionCache
+    from priority_prediction import PriorityPredictionModel
+
+    if model_path is not None:
+        return PriorityPredictionModel.load(model_path, PredictionCache())
+    pipeline = PriorityPredictionModel(random_state=42, prediction_cache=PredictionCache())
+    pipeline.train_quietly()
+    return pipeline
+
+
+async def _ingest(pipeline, store: PriorityStore, replay: Optional[str], args) -> Dict[str, float]:
+    ingestion = IngestionPipeline(pipeline, store, args.batch_size, args.max_wait_ms / 1000,
+                                  args.queue_size)
+    await ingestion.start()
+    try:
+        if replay is not None:
+            await ingestion.replay_file(replay)
+        else:
+            await ingestion.serve(args.host, args.port)
+    finally:
+        await ingestion.close()
+    return ingestion.metrics()
+
+
+def burst_benchmark(args) -> None:
+    """Replay a generated burst twice and compare with per-event scoring."""
+    import tempfile
+
+    from sklearn.datasets import load_breast_cancer
+
+    pipeline = _trained_pipeline(args.model)
+    data = load_breast_cancer()
+    issues = pd.DataFrame(data.data, columns=data.feature_names)
+
+    print("="*70)
+    print(" "*14 + "WEBHOOK INGESTION BURST-REPLAY BENCHMARK")
+    print("="*70)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        events_path = os.path.join(tmp_dir, 'events.jsonl')
+        make_burst_events(events_path, issues, args.events, args.issues)
+        print(f"Events: {args.events:,}  Issues: {args.issues:,}  Batch: {args.batch_size}  "
+              f"Intake queue: {args.queue_size}")
+
+        # Baseline: score every event on arrival, one call per event (store
+        # writes left out, which only flatters the baseline)
+        with open(events_path) as f:
+            sample = [parse_event(json.loads(line), pipeline.raw_feature_names)
+                      for _, line in zip(range(500), f)]
+        start_time = time.perf_counter()
+        for event in sample:
+            pipeline.score_issues(pd.DataFrame([event.features]))
+        sync_rate = len(sample) / (time.perf_counter() - start_time)
+
+        store = PriorityStore(os.path.join(tmp_dir, 'priorities.sqlite'), pipeline.class_names)
+        first = asyncio.run(_ingest(pipeline, store, events_path, args))
+        rows_after_first = store.count()
+        second = asyncio.run(_ingest(pipeline, store, events_path, args))
+        rows_after_second = store.count()
+        store.close()
+
+    # Compared on stored revisions: most received events are dedup drops
+    stored_rate = first['throughput_per_second']
+    received_rate = first['received'] / first['elapsed_seconds']
+    print(f"\n⏱  Synchronous, per event:  {sync_rate:10,.0f} revisions/s scored")
+    print(f"⏱  Async pipeline:          {stored_rate:10,.0f} revisions/s stored "
+          f"({stored_rate / sync_rate:.1f}x; {received_rate:,.0f} events/s received)")
+    print(f"🔁 Deduplicated:            {first['duplicates']:,} redelivered/stale, "
+          f"{first['coalesced']:,} coalesced in batch")
+    print(f"🧮 Scored:                  {first['scored']:,} in {first['batches']:,} batches")
+    print(f"📦 Max queue depth:         intake {first['max_intake_depth']} / {args.queue_size}, "
+          f"output {first['max_output_depth']} (bounded: backpressure held)")
+    print(f"⏳ Lag accepted->stored:    p50 {first['lag_p50_ms']:.1f} ms, "
+          f"p95 {first['lag_p95_ms']:.1f} ms, max {first['lag_max_ms']:.1f} ms")
+    print(f"✓ Idempotent replay:        {second['scored']} rescored, rows "
+          f"{rows_after_first:,} -> {rows_after_second:,}")
+    print("="*70)
+
+
+def main(argv=None):
+    """Ingest webhook events from a file or HTTP, or run the burst benchmark."""
+    parser = argparse.ArgumentParser(description="Backpressured webhook ingestion")
+    parser.add_argument('--model', default=None,
+                        help="model saved with --save-model (default: train on proxy data)")
+    parser.add_argument('--replay', default=None, metavar='JSONL', help="replay events from a file")
+    parser.add_argument('--serve', action='store_true', help="accept events over HTTP")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8090)
+    parser.add_argument('--output', default='priorities.sqlite', help="SQLite result store")
+    parser.add_argument('--batch-size', type=int, default=256, help="events per inference call")
+    parser.add_argument('--max-wait-ms', type=float, default=50, help="batch fill timeout")
+    parser.add_argument('--queue-size', type=int, default=2048, help="intake queue bound")
+    parser.add_argument('--benchmark', action='store_true', help="run the burst-replay benchmark")
+    parser.add_argument('--events', type=int, default=50_000, help="benchmark events")
+    parser.add_argument('--issues', type=int, default=2_000, help="benchmark distinct issues")
+    args = parser.parse_args(argv)
+
+    if args.benchmark:
+        burst_benchmark(args)
+        return
+    if args.replay is None and not args.serve:
+        parser.error("choose --replay FILE, --serve or --benchmark")
+
+    pipeline = _trained_pipeline(args.model)
+    store = PriorityStore(args.output, pipeline.class_names)
+    try:
+        metrics = asyncio.run(_ingest(pipeline, store, args.replay, args))
+    except KeyboardInterrupt:
+        return
+    finally:
+        store.close()
+    print(json.dumps(metrics, indent=2))
+
+
+if __name__ == "__main__":
+    main()